@@ -1 +1,42 @@
 __version__ = '0.1.12'
+
+import importlib
+
+# Public functions are only imported from their submodule when first
+# accessed, so that importing the package (e.g. to run the command line
+# interface) does not import pandas, numpy, requests and matplotlib.
+_LAZY_ATTRIBUTES = {
+    "fetch_matches_for_season": "sbdataextraction.sbdataextraction",
+    "fetch_seasons_for_league": "sbdataextraction.sbdataextraction",
+    "iter_matches_for_season": "sbdataextraction.sbdataextraction",
+    "get_shots_for_season": "sbdataextraction.sbdataextraction",
+    "get_shots_for_league": "sbdataextraction.sbdataextraction",
+    "draw_pitch": "sbdataextraction.sbdataextraction",
+    "plot_shot_freeze_frame": "sbdataextraction.sbdataextraction",
+    "plot_event": "sbdataextraction.sbdataextraction",
+    "write_season_bundle": "sbdataextraction.bundle",
+    "read_season_bundle": "sbdataextraction.bundle",
+    "read_game_from_bundle": "sbdataextraction.bundle",
+    "DerivedCache": "sbdataextraction.cache",
+    "CompactGame": "sbdataextraction.compact",
+    "run_league_pipeline": "sbdataextraction.pipeline",
+    "CSVSink": "sbdataextraction.pipeline",
+    "export_shot_images": "sbdataextraction.render",
+    "export_event_images": "sbdataextraction.render",
+    "PitchGrid": "sbdataextraction.heatmap",
+    "game_heatmaps": "sbdataextraction.heatmap",
+    "merge_heatmaps": "sbdataextraction.heatmap",
+    "plot_heatmap": "sbdataextraction.heatmap",
+    "ShotAggregateStore": "sbdataextraction.aggregates",
+}
+
+
+def __getattr__(name):
+    if name in _LAZY_ATTRIBUTES:
+        module = importlib.import_module(_LAZY_ATTRIBUTES[name])
+        return getattr(module, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(list(globals()) + list(_LAZY_ATTRIBUTES))
@@ -0,0 +1,3 @@
+from sbdataextraction.cli import main
+
+main()
@@ -0,0 +1,215 @@
+import json
+import os
+
+AGGREGATE_LEVELS = {"player": ("player_id", "player_name"),
+                    "team": ("team_id", "team_name")}
+
+# position of each total in the lists stored by ShotAggregateStore
+_SHOTS, _GOALS, _XG, _FIRST_TIME, _OPPONENTS = range(5)
+
+
+class ShotAggregateStore:
+    """
+    Per-player and per-team shot totals (shots, goals, xG, first time shots
+    and opponents between shot and goal), for each season and over all
+    seasons. Totals are updated one game at a time from the output of
+    Game.get_shots_for_game(), so adding a matchday only touches that
+    matchday's games, and a game can be removed again. If a path is given,
+    the store is loaded from it and can be saved back to it.
+    """
+
+    def __init__(self, path=None):
+        self.path = path
+        self._games = {}
+        self._totals = {}
+        self._names = {}
+        if path is not None and os.path.exists(path):
+            with open(path, "r", encoding="utf-8") as f:
+                saved = json.load(f)
+            self._names = {(level, key_id): name
+                           for level, key_id, name in saved["names"]}
+            for game in saved["games"]:
+                self._add_rows(game["game_id"], game["season_id"],
+                               game["rows"])
+
+    def __contains__(self, game_id):
+        return game_id in self._games
+
+    def __len__(self):
+        return len(self._games)
+
+    def _update_totals(self, season_id, rows, sign):
+        """
+        Helper function for _add_rows() and remove_game().
+        Adds (sign=1) or subtracts (sign=-1) the rows of a game to the
+        season totals and to the all seasons totals.
+        """
+        for level, key_id, *values in rows:
+            for key in ((level, key_id, season_id), (level, key_id, None)):
+                totals = self._totals.setdefault(key, [0, 0, 0.0, 0, 0])
+                for i, value in enumerate(values):
+                    totals[i] += sign*value
+                if totals[_SHOTS] == 0:
+                    del self._totals[key]
+
+    def _add_rows(self, game_id, season_id, rows):
+        """
+        Helper function for the constructor and add_game().
+        Records the rows of a game and adds them to the totals.
+        """
+        self._games[game_id] = {"season_id": season_id, "rows": rows}
+        self._update_totals(season_id, rows, 1)
+
+    def add_game(self, shot_df, game_id, season_id):
+        """
+        Adds the shots of a game to the totals. If the game was already
+        added, its previous shots are replaced.
+
+        Arguments
+        ---------
+        shot_df : pandas.DataFrame
+            - shots of the game, the output of Game.get_shots_for_game()
+        game_id : int
+            - id of the game
+        season_id : string or int
+            - season the game belongs to. Cannot be None, which is used for
+            the all seasons totals
+
+        Returns
+        -------
+        None
+
+        Examples
+        --------
+        store = ShotAggregateStore("shot_totals.json")
+        store.add_game(game.get_shots_for_game(), 69153, "2004/2005")
+        store.save()
+        """
+        assert season_id is not None, \
+            "season_id cannot be None, which stands for all seasons"
+        if game_id in self._games:
+            self.remove_game(game_id)
+
+        rows = []
+        for level, (id_column, name_column) in AGGREGATE_LEVELS.items():
+            grouped = shot_df.groupby(id_column)
+            totals = grouped.agg(
+                shots=("outcome", "size"),
+                goals=("outcome", lambda outcome: (outcome == "Goal").sum()),
+                xg=("statsbomb xg", "sum"),
+                first_time=("first time", "sum"),
+                opponents=("num opponents between shot and goal", "sum"),
+                name=(name_column, "last"))
+            for key_id, row in totals.iterrows():
+                key_id = int(key_id)
+                self._names[(level, key_id)] = row["name"]
+                rows.append([level, key_id, int(row["shots"]),
+                             int(row["goals"]), float(row["xg"]),
+                             int(row["first_time"]), int(row["opponents"])])
+
+        self._add_rows(game_id, season_id, rows)
+
+    def remove_game(self, game_id):
+        """
+        Removes the shots of a previously added game from the totals.
+
+        Arguments
+        ---------
+        game_id : int
+            - id of the game to remove
+
+        Returns
+        -------
+        None
+        """
+        assert game_id in self._games, f"game id {game_id} was never added"
+        game = self._games.pop(game_id)
+        self._update_totals(game["season_id"], game["rows"], -1)
+
+    def update_from_season(self, season_dict, season_id, cache=None):
+        """
+        Adds every game of a season that is not in the store yet.
+
+        Arguments
+        ---------
+        season_dict : dict
+            - mapping of game id's to a 'Game' object. Should be the output
+            of the fetch_matches_for_season() function
+        season_id : string or int
+            - season the games belong to, cannot be None
+        cache : sbdataextraction.cache.DerivedCache
+            - on-disk cache of extracted data frames, default to None
+
+        Returns
+        -------
+        list
+            - game id's of the games that were added
+        """
+        assert season_id is not None, \
+            "season_id cannot be None, which stands for all seasons"
+        added = []
+        for game_id, game_obj in season_dict.items():
+            if game_id not in self._games:
+                self.add_game(game_obj.get_shots_for_game(cache=cache),
+                              game_id, season_id)
+                added.append(game_id)
+        return added
+
+    def get(self, level, key_id, season_id=None):
+        """
+        Gets the shot totals of a player or team.
+
+        Arguments
+        ---------
+        level : string
+            - "player" or "team"
+        key_id : int
+            - player id or team id
+        season_id : string or int
+            - season to get the totals for, default to None (all seasons)
+
+        Returns
+        -------
+        dict
+            - name, shots, goals, xg (sum of Statsbomb xG), first time share
+            (fraction of shots taken first time) and avg opponents between
+            (average number of opponents between shot and goal), or None if
+            there are no shots for the specified key
+        """
+        assert level in AGGREGATE_LEVELS, \
+            f"level must be one of {list(AGGREGATE_LEVELS)}"
+        totals = self._totals.get((level, key_id, season_id))
+        if totals is None:
+            return None
+        shots = totals[_SHOTS]
+        return {"name": self._names.get((level, key_id)),
+                "shots": shots,
+                "goals": totals[_GOALS],
+                "xg": totals[_XG],
+                "first time share": totals[_FIRST_TIME] / shots,
+                "avg opponents between": totals[_OPPONENTS] / shots}
+
+    def save(self, path=None):
+        """
+        Saves the store as JSON.
+
+        Arguments
+        ---------
+        path : string
+            - file to save to, default to None (the path the store was
+            created with)
+
+        Returns
+        -------
+        None
+        """
+        path = self.path if path is None else path
+        assert path is not None, "a path must be given to save the store"
+        saved = {"names": [[level, key_id, name] for (level, key_id), name
+                           in self._names.items()],
+                 "games": [{"game_id": game_id, **game}
+                           for game_id, game in self._games.items()]}
+        tmp_path = path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(saved, f)
+        os.replace(tmp_path, path)
@@ -0,0 +1,180 @@
+import json
+import os
+import struct
+import zlib
+
+from sbdataextraction.sbdataextraction import Game
+
+# A season bundle is laid out as:
+#   magic | compressed game payloads... | JSON offset index | footer
+# where the footer holds the offset and length of the index followed by the
+# magic again, so that the index can be found with a single seek from the end.
+BUNDLE_MAGIC = b"SBDBNDL1"
+_FOOTER = struct.Struct("<QQ8s")
+
+
+def write_season_bundle(season_dict, path, compression_level=6):
+    """
+    Writes every game of a season to a single bundle file. Each game's raw
+    event data is compressed separately, and an index mapping game id's to the
+    position of their data in the file is written at the end, so that one
+    game can be read back without reading the rest of the file.
+
+    Arguments
+    ---------
+    season_dict : dict
+        - mapping of game id's to a 'Game' object with a
+        json_file attribute (the event data for that game as a JSON file).
+        Should be the output of the fetch_matches_for_season() function.
+    path : string
+        - path of the bundle file to write
+    compression_level : int
+        - zlib compression level, from 1 (fastest) to 9 (smallest),
+        default to 6
+
+    Returns
+    -------
+    dict
+        - the bundle's index, mapping game id's to the (offset, length)
+        of their compressed event data in the file
+
+    Examples
+    --------
+    season_11_37 = fetch_matches_for_season(11, 37)
+    write_season_bundle(season_11_37, "season_11_37.sbd")
+    """
+    index = {}
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(BUNDLE_MAGIC)
+        for game_id, game_obj in season_dict.items():
+            # the raw payload is stored, so that games read back from the
+            # bundle have the same payload_hash as the original games
+            compressed = zlib.compress(game_obj.payload, compression_level)
+            index[game_id] = (f.tell(), len(compressed))
+            f.write(compressed)
+
+        index_offset = f.tell()
+        index_bytes = json.dumps({str(game_id): list(location)
+                                  for game_id, location in index.items()})
+        index_bytes = index_bytes.encode("utf-8")
+        f.write(index_bytes)
+        f.write(_FOOTER.pack(index_offset, len(index_bytes), BUNDLE_MAGIC))
+    os.replace(tmp_path, path)
+
+    return index
+
+
+def _parse_footer(footer, path):
+    """
+    Helper function for the bundle readers.
+    Returns the offset and length of the index stored in a bundle's footer.
+    """
+    index_offset, index_length, magic = _FOOTER.unpack(footer)
+    assert magic == BUNDLE_MAGIC, f"{path} is not a season bundle"
+    return index_offset, index_length
+
+
+def _parse_index(index_bytes):
+    """
+    Helper function for the bundle readers.
+    Converts the JSON index of a bundle back to a mapping of game id's to
+    (offset, length) tuples.
+    """
+    return {int(game_id): tuple(location)
+            for game_id, location in json.loads(index_bytes).items()}
+
+
+def read_bundle_index(path):
+    """
+    Reads the index of a season bundle without reading any game data.
+
+    Arguments
+    ---------
+    path : string
+        - path of a bundle file written by write_season_bundle()
+
+    Returns
+    -------
+    dict
+        - mapping of game id's to the (offset, length) of their compressed
+        event data in the file
+    """
+    with open(path, "rb") as f:
+        f.seek(-_FOOTER.size, os.SEEK_END)
+        index_offset, index_length = _parse_footer(f.read(_FOOTER.size),
+                                                   path)
+        f.seek(index_offset)
+        return _parse_index(f.read(index_length))
+
+
+def read_game_from_bundle(path, game_id, index=None):
+    """
+    Reads a single game from a season bundle.
+
+    Arguments
+    ---------
+    path : string
+        - path of a bundle file written by write_season_bundle()
+    game_id : int
+        - id of the game to read. Must be in the bundle's index
+    index : dict
+        - the bundle's index, as returned by read_bundle_index(). Pass it in
+        when reading several games from the same bundle to avoid re-reading
+        the index every time. Default to None (the index is read from file)
+
+    Returns
+    -------
+    Game
+        - game object for the specified game id
+
+    Examples
+    --------
+    read_game_from_bundle("season_11_37.sbd", 69153)
+    """
+    if index is None:
+        index = read_bundle_index(path)
+    assert game_id in index, f"Cannot find game id {game_id} in {path}"
+
+    offset, length = index[game_id]
+    with open(path, "rb") as f:
+        f.seek(offset)
+        payload = zlib.decompress(f.read(length))
+
+    return Game(payload, match_id=game_id)
+
+
+def read_season_bundle(path):
+    """
+    Reads every game of a season bundle with one sequential read of the file.
+
+    Arguments
+    ---------
+    path : string
+        - path of a bundle file written by write_season_bundle()
+
+    Returns
+    -------
+    dict
+        - mapping of game id's to a 'Game' object with a
+        json_file attribute (the event data for that game as a JSON file),
+        in the same format as the output of fetch_matches_for_season().
+
+    Examples
+    --------
+    season_11_37 = read_season_bundle("season_11_37.sbd")
+    get_shots_for_season(season_11_37)
+    """
+    with open(path, "rb") as f:
+        data = memoryview(f.read())
+
+    index_offset, index_length = _parse_footer(data[-_FOOTER.size:], path)
+    index = _parse_index(bytes(data[index_offset:index_offset +
+                                    index_length]))
+
+    game_num_dict = {}
+    for game_id, (offset, length) in index.items():
+        payload = zlib.decompress(data[offset:offset + length])
+        game_num_dict[game_id] = Game(payload, match_id=game_id)
+
+    return game_num_dict
@@ -0,0 +1,64 @@
+import os
+import pandas as pd
+
+
+class DerivedCache:
+    """
+    On-disk cache of data frames derived from a game's event data, such as
+    the output of Game.get_shots_for_game() and Game.get_events_for_game().
+
+    Entries are keyed by the kind of data frame, the game id, a hash of the
+    game's raw event data and the version of the code that extracted them,
+    so a cached data frame is only reused if neither the raw data nor the
+    extraction code changed since it was written.
+    """
+
+    def __init__(self, cache_dir):
+        self.cache_dir = cache_dir
+
+    def _path(self, kind, match_id, payload_hash, version):
+        """
+        Helper function for get() and put().
+        Returns the path of the file holding the specified cache entry.
+        """
+        return os.path.join(self.cache_dir, kind,
+                            f"{match_id}-{payload_hash}-v{version}.pkl")
+
+    def get(self, kind, match_id, payload_hash, version):
+        """
+        Loads a cached data frame.
+
+        Arguments
+        ---------
+        kind : string
+            - kind of data frame, e.g. "shots" or "events"
+        match_id : int
+            - game id of the game the data frame was derived from
+        payload_hash : string
+            - hash of the game's raw event data
+        version : int
+            - version of the code that extracted the data frame
+
+        Returns
+        -------
+        pandas.DataFrame
+            - the cached data frame, or None if there is no such entry
+        """
+        path = self._path(kind, match_id, payload_hash, version)
+        if not os.path.exists(path):
+            return None
+        return pd.read_pickle(path)
+
+    def put(self, kind, match_id, payload_hash, version, df):
+        """
+        Saves a data frame to the cache. See get() for the arguments.
+
+        Returns
+        -------
+        None
+        """
+        path = self._path(kind, match_id, payload_hash, version)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = path + ".tmp"
+        df.to_pickle(tmp_path)
+        os.replace(tmp_path, path)
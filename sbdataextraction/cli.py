@@ -0,0 +1,200 @@
+"""
+Command line interface for sbdataextraction.
+
+Each subcommand imports the parts of the package it needs when it runs,
+so that commands which only read Statsbomb metadata (e.g. listing
+competitions and seasons) start without importing pandas, numpy,
+requests or matplotlib.
+"""
+import argparse
+import contextlib
+import json
+import sys
+import urllib.request
+
+from sbdataextraction.urls import COMPETITIONS_URL, EVENTS_URL
+
+
+def _fetch_league_or_season(args):
+    """
+    Helper function for the fetch, shots and export subcommands.
+    Fetches a single season if args.season_id is set, otherwise every season
+    of args.competition_id, and returns a league dictionary in the format of
+    fetch_seasons_for_league().
+    """
+    from sbdataextraction import sbdataextraction as sbd
+
+    # progress is reported on stderr so that stdout can hold the output
+    with contextlib.redirect_stdout(sys.stderr):
+        if args.season_id is None:
+            return sbd.fetch_seasons_for_league(
+                args.competition_id, verbose=not args.quiet,
+                checkpoint_dir=args.checkpoint_dir)
+        season = sbd.fetch_matches_for_season(
+            args.competition_id, args.season_id, verbose=not args.quiet,
+            checkpoint_dir=args.checkpoint_dir)
+        return {str(args.season_id): season}
+
+
+def _write_df(df, output):
+    """
+    Helper function for the shots and events subcommands.
+    Writes a data frame as csv to the output path, or to stdout if output
+    is None.
+    """
+    df.to_csv(output if output is not None else sys.stdout)
+
+
+def competitions(args):
+    """
+    Lists the competitions and seasons available in the Statsbomb open data.
+    """
+    with urllib.request.urlopen(COMPETITIONS_URL, timeout=30) as response:
+        competitions_statsbomb = json.loads(response.read())
+
+    print("competition_id\tseason_id\tcompetition_name\tseason_name")
+    for comps in competitions_statsbomb:
+        if args.competition_id is not None and \
+           comps['competition_id'] != args.competition_id:
+            continue
+        print(f"{comps['competition_id']}\t{comps['season_id']}\t"
+              f"{comps['competition_name']}\t{comps['season_name']}")
+
+
+def fetch(args):
+    """
+    Downloads the event data for a competition or season into a checkpoint
+    directory. Rerunning the command resumes an interrupted download.
+    """
+    league = _fetch_league_or_season(args)
+    num_games = sum(len(season) for season in league.values())
+    print(f"{num_games} games saved to {args.checkpoint_dir}")
+
+
+def shots(args):
+    """
+    Writes the shots taken in a competition or season to a csv file.
+    """
+    from sbdataextraction import sbdataextraction as sbd
+    from sbdataextraction.cache import DerivedCache
+
+    cache = None
+    if args.cache_dir is not None:
+        cache = DerivedCache(args.cache_dir)
+
+    league = _fetch_league_or_season(args)
+    with contextlib.redirect_stdout(sys.stderr):
+        shot_df = sbd.get_shots_for_league(
+            league, cache=cache, geometry_features=args.geometry)
+    _write_df(shot_df, args.output)
+
+
+def events(args):
+    """
+    Writes the passes, ball receipts, carries and shots of a game to a
+    csv file.
+    """
+    if args.bundle is not None:
+        from sbdataextraction.bundle import read_game_from_bundle
+        game = read_game_from_bundle(args.bundle, args.match_id)
+    else:
+        from sbdataextraction import sbdataextraction as sbd
+        game = sbd.Game(sbd._get_with_retry(EVENTS_URL +
+                                            f"/{args.match_id}.json"),
+                        match_id=args.match_id)
+    _write_df(game.get_events_for_game(), args.output)
+
+
+def export(args):
+    """
+    Writes every game of a season to a season bundle file.
+    """
+    from sbdataextraction.bundle import write_season_bundle
+
+    league = _fetch_league_or_season(args)
+    index = write_season_bundle(league[str(args.season_id)], args.output)
+    print(f"{len(index)} games written to {args.output}")
+
+
+def _build_parser():
+    """
+    Helper function for main().
+    Builds the argument parser for all subcommands.
+    """
+    parser = argparse.ArgumentParser(
+        prog="sbdataextraction",
+        description="Get Statsbomb public data from the command line.")
+    subparsers = parser.add_subparsers(dest="command")
+    subparsers.required = True
+
+    competitions_parser = subparsers.add_parser(
+        "competitions", help="list competitions and seasons")
+    competitions_parser.add_argument("--competition-id", type=int,
+                                     help="only list this competition")
+    competitions_parser.set_defaults(func=competitions)
+
+    def add_fetch_arguments(subparser, season_required=False,
+                            checkpoint_required=False):
+        subparser.add_argument("competition_id", type=int)
+        if season_required:
+            subparser.add_argument("season_id", type=int)
+        else:
+            subparser.add_argument("--season-id", type=int,
+                                   help="only use this season")
+        subparser.add_argument("--checkpoint-dir",
+                               required=checkpoint_required,
+                               help="directory in which downloaded games "
+                                    "are saved, so that reruns resume")
+        subparser.add_argument("--quiet", action="store_true",
+                               help="do not print progress bars")
+
+    fetch_parser = subparsers.add_parser(
+        "fetch", help="download event data to a checkpoint directory")
+    add_fetch_arguments(fetch_parser, checkpoint_required=True)
+    fetch_parser.set_defaults(func=fetch)
+
+    shots_parser = subparsers.add_parser(
+        "shots", help="write shots of a competition or season as csv")
+    add_fetch_arguments(shots_parser)
+    shots_parser.add_argument("--cache-dir",
+                              help="directory of cached shot data frames")
+    shots_parser.add_argument("--geometry", action="store_true",
+                              help="add distance, angle and blocked goal "
+                                   "fraction columns")
+    shots_parser.add_argument("-o", "--output",
+                              help="csv file to write, default to stdout")
+    shots_parser.set_defaults(func=shots)
+
+    events_parser = subparsers.add_parser(
+        "events", help="write events of a game as csv")
+    events_parser.add_argument("match_id", type=int)
+    events_parser.add_argument("--bundle",
+                               help="season bundle to read the game from")
+    events_parser.add_argument("-o", "--output",
+                               help="csv file to write, default to stdout")
+    events_parser.set_defaults(func=events)
+
+    export_parser = subparsers.add_parser(
+        "export", help="write a season to a season bundle file")
+    add_fetch_arguments(export_parser, season_required=True)
+    export_parser.add_argument("output", help="bundle file to write")
+    export_parser.set_defaults(func=export)
+
+    return parser
+
+
+def main(argv=None):
+    """
+    Entry point of the sbdataextraction command.
+
+    Arguments
+    ---------
+    argv : list of strings
+        - command line arguments, default to sys.argv[1:]
+
+    Returns
+    -------
+    None
+    """
+    args = _build_parser().parse_args(argv)
+    args.func(args)
@@ -0,0 +1,194 @@
+import json
+import sys
+import zlib
+from collections.abc import Mapping
+from sbdataextraction.sbdataextraction import Game
+
+# Event fields stored directly on CompactEvent objects. The type specific
+# payloads ("shot", "pass"...) and related events are kept as parsed
+# dictionaries, and only the rarely used fields below are kept as raw JSON
+# until they are accessed.
+_SLOT_FIELDS = ("id", "index", "period", "timestamp", "minute", "second",
+                "type", "possession", "possession_team", "play_pattern",
+                "team", "player", "position", "location", "duration")
+_RAW_FIELDS = ("tactics",)
+_SLOT_FIELD_SET = frozenset(_SLOT_FIELDS)
+
+# Fields holding small {"id": ..., "name": ...} dictionaries, which repeat
+# across thousands of events and are shared between them
+_INTERNED_FIELDS = ("type", "possession_team", "play_pattern", "team",
+                    "player", "position")
+
+
+def _intern(value, intern_table):
+    """
+    Helper function for CompactEvent.
+    Returns the shared copy of a hashable value (or of a small dictionary of
+    hashable values) from intern_table, adding it if it is new.
+    """
+    if isinstance(value, dict):
+        key = ("dict",) + tuple(value.items())
+        try:
+            hash(key)
+        except TypeError:
+            return value
+        if key not in intern_table:
+            intern_table[key] = {sys.intern(k): sys.intern(v)
+                                 if isinstance(v, str) else v
+                                 for k, v in value.items()}
+        return intern_table[key]
+    return intern_table.setdefault(value, value)
+
+
+def _intern_payload(value, intern_table):
+    """
+    Helper function for CompactEvent.
+    Shares the small dictionaries (e.g. outcome, body part, technique) nested
+    in a type specific payload such as "shot" or "pass".
+    """
+    if not isinstance(value, dict):
+        return value
+    return {sys.intern(k): _intern(v, intern_table)
+            if isinstance(v, dict) else v for k, v in value.items()}
+
+
+class CompactEvent(Mapping):
+    """
+    Read-only, memory efficient version of one event of a Game object's
+    json_file. It can be used exactly like the original dictionary.
+
+    Common fields are stored in slots, repeated dictionaries (team, player,
+    type, play pattern, outcomes...) are shared between events through an
+    intern table, and rarely used fields such as tactics are stored as raw
+    JSON, which is parsed every time one of them is accessed. Fields that
+    are not in the event are left unset, so events can be pickled (e.g. to
+    send them to worker processes).
+    """
+    __slots__ = _SLOT_FIELDS + ("_extra", "_raw_keys", "_raw")
+
+    def __init__(self, event, intern_table):
+        extra = {}
+        raw = {}
+        for key, value in event.items():
+            if key in _INTERNED_FIELDS:
+                value = _intern(value, intern_table)
+            elif key in _RAW_FIELDS:
+                raw[key] = value
+                continue
+            elif key not in _SLOT_FIELDS:
+                extra[sys.intern(key)] = _intern_payload(value,
+                                                         intern_table)
+                continue
+            setattr(self, key, value)
+
+        self._extra = extra if extra else None
+        self._raw_keys = _intern(tuple(raw), intern_table)
+        self._raw = json.dumps(raw, separators=(",", ":")).encode("utf-8") \
+            if raw else None
+
+    def __getitem__(self, key):
+        if key in _SLOT_FIELD_SET:
+            try:
+                return getattr(self, key)
+            except AttributeError:
+                raise KeyError(key) from None
+        if self._extra is not None and key in self._extra:
+            return self._extra[key]
+        if key in self._raw_keys:
+            return json.loads(self._raw)[key]
+        raise KeyError(key)
+
+    def __contains__(self, key):
+        if key in _SLOT_FIELD_SET:
+            return hasattr(self, key)
+        return (self._extra is not None and key in self._extra) or \
+            key in self._raw_keys
+
+    def __iter__(self):
+        for key in _SLOT_FIELDS:
+            if hasattr(self, key):
+                yield key
+        if self._extra is not None:
+            yield from self._extra
+        yield from self._raw_keys
+
+    def __len__(self):
+        return sum(1 for _ in self)
+
+    def __repr__(self):
+        return f"CompactEvent({dict(self)!r})"
+
+
+class CompactGame(Game):
+    """
+    Memory efficient version of a Game object. Its json_file attribute is a
+    list of CompactEvent objects instead of dictionaries, so all Game
+    methods and the plotting functions work on it unchanged.
+
+    Games can share an intern table (e.g. all games of a season), so that
+    team and player dictionaries are only stored once across all of them.
+    The raw payload is kept compressed, and only decompressed when accessed
+    (e.g. to write the game to a season bundle).
+    """
+
+    @property
+    def payload(self):
+        return zlib.decompress(self._compressed_payload)
+
+    @payload.setter
+    def payload(self, payload):
+        self._compressed_payload = zlib.compress(payload)
+
+    def __init__(self, json_file, match_id=None, intern_table=None):
+        super().__init__(json_file, match_id=match_id)
+        self._intern_table = {} if intern_table is None else intern_table
+
+    def _parse_payload(self):
+        """
+        Helper function for the json_file property.
+        Parses the raw payload into a list of CompactEvent objects.
+        """
+        return self._compact_events(json.loads(self.payload))
+
+    def _compact_events(self, events):
+        """
+        Helper function for _parse_payload() and from_game().
+        Converts event dictionaries to CompactEvent objects.
+        """
+        return [CompactEvent(event, self._intern_table) for event in events]
+
+    @classmethod
+    def from_game(cls, game, intern_table=None):
+        """
+        Creates a CompactGame from an existing Game object, without parsing
+        its event data again.
+
+        Arguments
+        ---------
+        game : Game
+            - game object to convert
+        intern_table : dict
+            - intern table shared with other games, default to None
+
+        Returns
+        -------
+        CompactGame
+            - compact version of the game
+
+        Examples
+        --------
+        compact_game = CompactGame.from_game(season_11_37[69153])
+        compact_game.get_shots_for_game()
+        """
+        compact_game = cls.__new__(cls)
+        compact_game.payload = game.payload
+        compact_game.match_id = game.match_id
+        compact_game.payload_hash = game.payload_hash
+        compact_game._intern_table = {} if intern_table is None \
+            else intern_table
+        compact_game._json_file = None
+        if game._json_file is not None:
+            compact_game._json_file = \
+                compact_game._compact_events(game._json_file)
+        compact_game._derived = {}
+        return compact_game
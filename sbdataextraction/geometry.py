@@ -0,0 +1,231 @@
+import numpy as np
+
+# Statsbomb pitch coordinates of the goal being attacked. See here:
+# https://github.com/statsbomb/open-data/blob/master/doc/StatsBomb%20Open%20Data%20Specification%20v1.1.pdf
+GOAL_X = 120
+LEFT_POST_Y = 36
+RIGHT_POST_Y = 44
+
+
+def distance_to_goal(x, y):
+    """
+    Computes the distance from shot locations to the center of the goal.
+
+    Arguments
+    ---------
+    x : numpy.ndarray
+        - x-locations of shots
+    y : numpy.ndarray
+        - y-locations of shots
+
+    Returns
+    -------
+    numpy.ndarray
+        - distance of each shot to the center of the goal, in yards
+    """
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    return np.hypot(GOAL_X - x, (LEFT_POST_Y + RIGHT_POST_Y) / 2 - y)
+
+
+def shot_angle(x, y):
+    """
+    Computes the opening angle between the two posts as seen from shot
+    locations.
+
+    Arguments
+    ---------
+    x : numpy.ndarray
+        - x-locations of shots
+    y : numpy.ndarray
+        - y-locations of shots
+
+    Returns
+    -------
+    numpy.ndarray
+        - angle between the lines connecting each shot to the two posts,
+        in radians
+    """
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    dx = GOAL_X - x
+    dy_left = LEFT_POST_Y - y
+    dy_right = RIGHT_POST_Y - y
+    cross = dx*dy_right - dy_left*dx
+    dot = dx*dx + dy_left*dy_right
+    return np.arctan2(np.abs(cross), dot)
+
+
+def between_shot_and_goal(x_shot, y_shot, x_player, y_player):
+    """
+    Checks whether players are between shot locations and the two lines
+    connecting the shot locations to the posts. Vectorized version of
+    Game.check_player_btwn_shot_and_goal().
+
+    Arguments
+    ---------
+    x_shot : numpy.ndarray
+        - x-location of the shot each player is checked against
+    y_shot : numpy.ndarray
+        - y-location of the shot each player is checked against
+    x_player : numpy.ndarray
+        - x-locations of players
+    y_player : numpy.ndarray
+        - y-locations of players
+
+    Returns
+    -------
+    numpy.ndarray
+        - boolean array, True for each player between shot and goal
+    """
+    x_shot = np.asarray(x_shot, dtype=float)
+    y_shot = np.asarray(y_shot, dtype=float)
+    x_player = np.asarray(x_player, dtype=float)
+    y_player = np.asarray(y_player, dtype=float)
+
+    x_diff = x_player - x_shot
+    dx = GOAL_X - x_shot
+    valid = dx != 0
+    safe_dx = np.where(valid, dx, 1)
+    slope_1 = (LEFT_POST_Y - y_shot) / safe_dx
+    slope_2 = (RIGHT_POST_Y - y_shot) / safe_dx
+
+    btwn = (y_shot + slope_1*x_diff < y_player) & \
+           (y_player < y_shot + slope_2*x_diff)
+    return valid & (x_diff >= 0) & btwn
+
+
+def goal_blocked_fraction(x_shot, y_shot, frame_shot_index, x_player,
+                          y_player, player_radius=0.5, num_samples=80,
+                          is_goalkeeper=None, has_frame=None):
+    """
+    Computes the fraction of the goal mouth hidden behind players, as seen
+    from shot locations. Each player is modelled as a disc of radius
+    player_radius, and the goal mouth is sampled at num_samples evenly
+    spaced points; a point is hidden if the line from the shot to that
+    point passes through a player. Goalkeepers are ignored, like in the
+    "num opponents between shot and goal" feature of
+    Game.get_shots_for_game().
+
+    Arguments
+    ---------
+    x_shot : numpy.ndarray
+        - x-locations of shots
+    y_shot : numpy.ndarray
+        - y-locations of shots
+    frame_shot_index : numpy.ndarray
+        - flattened freeze frames: for each player, the position in x_shot
+        of the shot whose freeze frame the player is in
+    x_player : numpy.ndarray
+        - flattened freeze frames: x-location of each player
+    y_player : numpy.ndarray
+        - flattened freeze frames: y-location of each player
+    player_radius : float
+        - radius of a player, in yards, default to 0.5
+    num_samples : int
+        - number of points at which the goal mouth is sampled, default to 80
+    is_goalkeeper : numpy.ndarray
+        - flattened freeze frames: True for each player that is a
+        goalkeeper, default to None (no goalkeepers)
+    has_frame : numpy.ndarray
+        - True for each shot with a freeze frame, default to None (shots
+        with at least one player in frame_shot_index)
+
+    Returns
+    -------
+    numpy.ndarray
+        - fraction of the goal mouth hidden from each shot, between 0 and 1,
+        or NaN for shots without a freeze frame
+    """
+    x_shot = np.asarray(x_shot, dtype=float)
+    y_shot = np.asarray(y_shot, dtype=float)
+    frame_shot_index = np.asarray(frame_shot_index, dtype=int)
+    x_player = np.asarray(x_player, dtype=float)
+    y_player = np.asarray(y_player, dtype=float)
+
+    if is_goalkeeper is None:
+        is_goalkeeper = np.zeros(len(frame_shot_index), dtype=bool)
+    is_goalkeeper = np.asarray(is_goalkeeper, dtype=bool)
+
+    if has_frame is None:
+        has_frame = np.bincount(frame_shot_index, minlength=len(x_shot)) > 0
+    has_frame = np.asarray(has_frame, dtype=bool)
+    blocked = np.zeros((len(x_shot), num_samples), dtype=int)
+    if len(frame_shot_index) == 0:
+        return np.where(has_frame, 0.0, np.nan)
+
+    xs = x_shot[frame_shot_index]
+    ys = y_shot[frame_shot_index]
+    dx = x_player - xs
+    dy = y_player - ys
+    dist = np.hypot(dx, dy)
+
+    # only players in front of the shot and in front of the goal line
+    # can hide part of the goal
+    in_front = (dx > 0) & (x_player <= GOAL_X) & (xs < GOAL_X) & \
+        ~is_goalkeeper
+    center = np.arctan2(dy, dx)
+    half_width = np.arcsin(np.clip(player_radius / np.maximum(dist, 1e-9),
+                                   0, 1))
+    lo = np.clip(center - half_width, -np.pi/2 + 1e-6, np.pi/2 - 1e-6)
+    hi = np.clip(center + half_width, -np.pi/2 + 1e-6, np.pi/2 - 1e-6)
+
+    # project each player's shadow onto the goal line
+    y_lo = ys + (GOAL_X - xs)*np.tan(lo)
+    y_hi = ys + (GOAL_X - xs)*np.tan(hi)
+
+    samples = np.linspace(LEFT_POST_Y, RIGHT_POST_Y, num_samples)
+    covered = (samples >= y_lo[:, None]) & (samples <= y_hi[:, None]) & \
+        in_front[:, None]
+    np.add.at(blocked, frame_shot_index, covered)
+
+    return np.where(has_frame, (blocked > 0).mean(axis=1), np.nan)
+
+
+def shot_geometry(x_shot, y_shot, frame_shot_index, x_player, y_player,
+                  player_radius=0.5, is_goalkeeper=None, has_frame=None):
+    """
+    Computes all shot geometry features for a batch of shots at once.
+
+    Arguments
+    ---------
+    x_shot : numpy.ndarray
+        - x-locations of shots
+    y_shot : numpy.ndarray
+        - y-locations of shots
+    frame_shot_index : numpy.ndarray
+        - flattened freeze frames: for each player, the position in x_shot
+        of the shot whose freeze frame the player is in
+    x_player : numpy.ndarray
+        - flattened freeze frames: x-location of each player
+    y_player : numpy.ndarray
+        - flattened freeze frames: y-location of each player
+    player_radius : float
+        - radius of a player, in yards, default to 0.5
+    is_goalkeeper : numpy.ndarray
+        - flattened freeze frames: True for each player that is a
+        goalkeeper, default to None (no goalkeepers)
+    has_frame : numpy.ndarray
+        - True for each shot with a freeze frame, default to None (shots
+        with at least one player in frame_shot_index)
+
+    Returns
+    -------
+    dict
+        - "distance", "angle" and "blocked fraction" map to arrays with one
+        value per shot; "between" maps to a boolean array with one value per
+        freeze frame player (see between_shot_and_goal())
+    """
+    x_shot = np.asarray(x_shot, dtype=float)
+    y_shot = np.asarray(y_shot, dtype=float)
+    frame_shot_index = np.asarray(frame_shot_index, dtype=int)
+
+    return {"distance": distance_to_goal(x_shot, y_shot),
+            "angle": shot_angle(x_shot, y_shot),
+            "between": between_shot_and_goal(x_shot[frame_shot_index],
+                                             y_shot[frame_shot_index],
+                                             x_player, y_player),
+            "blocked fraction": goal_blocked_fraction(
+                x_shot, y_shot, frame_shot_index, x_player, y_player,
+                player_radius=player_radius, is_goalkeeper=is_goalkeeper,
+                has_frame=has_frame)}
@@ -0,0 +1,259 @@
+import numpy as np
+from sbdataextraction.sbdataextraction import draw_pitch
+
+# Statsbomb pitch dimensions, as drawn by draw_pitch(axis, rotate=True)
+PITCH_LENGTH = 120
+PITCH_WIDTH = 80
+
+
+class PitchGrid:
+    """
+    Grid of zones on the 120x80 Statsbomb pitch, defined by the edges of its
+    columns along the length of the pitch (x_edges) and of its rows across
+    the width of the pitch (y_edges). Zones do not have to be evenly sized.
+    """
+
+    def __init__(self, x_edges, y_edges):
+        self.x_edges = np.asarray(x_edges, dtype=float)
+        self.y_edges = np.asarray(y_edges, dtype=float)
+        assert np.all(np.diff(self.x_edges) > 0) and \
+            np.all(np.diff(self.y_edges) > 0), \
+            "grid edges must be strictly increasing"
+        self.shape = (len(self.x_edges) - 1, len(self.y_edges) - 1)
+
+    @classmethod
+    def uniform(cls, nx=12, ny=8):
+        """
+        Creates a grid of nx by ny zones of equal size.
+
+        Arguments
+        ---------
+        nx : int
+            - number of zones along the length of the pitch, default to 12
+        ny : int
+            - number of zones across the width of the pitch, default to 8
+
+        Returns
+        -------
+        PitchGrid
+            - the grid
+        """
+        return cls(np.linspace(0, PITCH_LENGTH, nx + 1),
+                   np.linspace(0, PITCH_WIDTH, ny + 1))
+
+    @classmethod
+    def thirds_and_channels(cls):
+        """
+        Creates a grid splitting the pitch into thirds along its length, and
+        into five channels across its width, aligned with the edges of the
+        penalty area and of the six yard box.
+
+        Returns
+        -------
+        PitchGrid
+            - the grid
+        """
+        return cls([0, 40, 80, 120], [0, 18, 30, 50, 62, 80])
+
+    def __eq__(self, other):
+        return isinstance(other, PitchGrid) and \
+            np.array_equal(self.x_edges, other.x_edges) and \
+            np.array_equal(self.y_edges, other.y_edges)
+
+    def bin(self, x, y):
+        """
+        Finds the zone of each location.
+
+        Arguments
+        ---------
+        x : numpy.ndarray
+            - x-locations
+        y : numpy.ndarray
+            - y-locations
+
+        Returns
+        -------
+        numpy.ndarray
+            - flat index of the zone of each location (row-major over
+            self.shape), or -1 for locations outside of the grid
+        """
+        x = np.asarray(x, dtype=float)
+        y = np.asarray(y, dtype=float)
+        # locations on the last edge belong to the last zone
+        x_bin = np.minimum(np.searchsorted(self.x_edges, x, side="right") - 1,
+                           self.shape[0] - 1)
+        y_bin = np.minimum(np.searchsorted(self.y_edges, y, side="right") - 1,
+                           self.shape[1] - 1)
+        inside = (x >= self.x_edges[0]) & (x <= self.x_edges[-1]) & \
+                 (y >= self.y_edges[0]) & (y <= self.y_edges[-1])
+        return np.where(inside, x_bin*self.shape[1] + y_bin, -1)
+
+
+class Heatmap:
+    """
+    Number of events and sum of their Statsbomb xG in each zone of a
+    PitchGrid. Heatmaps over the same grid can be added together (e.g. to
+    update a season heatmap with a new game) and subtracted (e.g. to remove
+    a game again).
+    """
+
+    def __init__(self, grid, counts=None, xg_sum=None):
+        self.grid = grid
+        self.counts = np.zeros(grid.shape, dtype=np.int64) \
+            if counts is None else counts
+        self.xg_sum = np.zeros(grid.shape) if xg_sum is None else xg_sum
+
+    def _check_grid(self, other):
+        assert self.grid == other.grid, \
+            "heatmaps must be defined over the same grid"
+
+    def __add__(self, other):
+        self._check_grid(other)
+        return Heatmap(self.grid, self.counts + other.counts,
+                       self.xg_sum + other.xg_sum)
+
+    def __sub__(self, other):
+        self._check_grid(other)
+        return Heatmap(self.grid, self.counts - other.counts,
+                       self.xg_sum - other.xg_sum)
+
+    def xg_per_event(self):
+        """
+        Computes the average xG of the events in each zone.
+
+        Returns
+        -------
+        numpy.ndarray
+            - average xG per zone, 0 for zones without events
+        """
+        return np.divide(self.xg_sum, self.counts,
+                         out=np.zeros(self.grid.shape),
+                         where=self.counts > 0)
+
+
+def game_heatmaps(df, grid, by=None, event_name="shot"):
+    """
+    Bins the events of a game into heatmaps, optionally one per team or
+    player.
+
+    Arguments
+    ---------
+    df : pandas.DataFrame
+        - output of Game.get_events_for_game(), or of
+        Game.get_shots_for_game()
+    grid : PitchGrid
+        - zones to bin the events' start locations into
+    by : string
+        - column to group events by, e.g. "team_id" or "player_id",
+        default to None (one heatmap for the whole game)
+    event_name : string
+        - only bin events of this type, if df has an "event name" column.
+        Default to "shot"
+
+    Returns
+    -------
+    dict
+        - mapping of each value of the by column (or None if by is None) to
+        its Heatmap
+
+    Examples
+    --------
+    grid = PitchGrid.uniform(12, 8)
+    game_heatmaps(game.get_shots_for_game(), grid, by="player_id")
+    """
+    if "event name" in df.columns:
+        df = df[df["event name"] == event_name]
+
+    bins = grid.bin(df["x start location"].values,
+                    df["y start location"].values)
+    xg = np.clip(df["statsbomb xg"].values.astype(float), 0, None)
+    inside = bins >= 0
+    num_bins = grid.shape[0]*grid.shape[1]
+
+    if by is None:
+        keys = [None]
+        group = np.zeros(len(df), dtype=int)
+    else:
+        keys, group = np.unique(df[by].values, return_inverse=True)
+
+    # bin every group at once, with one bin per (group, zone) pair
+    flat = group[inside]*num_bins + bins[inside]
+    size = len(keys)*num_bins
+    counts = np.bincount(flat, minlength=size).reshape(len(keys), *grid.shape)
+    xg_sum = np.bincount(flat, weights=xg[inside],
+                         minlength=size).reshape(len(keys), *grid.shape)
+
+    return {key: Heatmap(grid, counts[i], xg_sum[i])
+            for i, key in enumerate(keys)}
+
+
+def merge_heatmaps(store, heatmaps):
+    """
+    Adds heatmaps to a store of heatmaps in place, e.g. to update season,
+    team or player heatmaps with the heatmaps of a new game.
+
+    Arguments
+    ---------
+    store : dict
+        - mapping of keys to Heatmaps, updated in place
+    heatmaps : dict
+        - mapping of keys to Heatmaps to add, e.g. the output of
+        game_heatmaps()
+
+    Returns
+    -------
+    dict
+        - the updated store
+
+    Examples
+    --------
+    season_heatmaps = {}
+    for game_id, game in season_11_37.items():
+        merge_heatmaps(season_heatmaps,
+                       game_heatmaps(game.get_shots_for_game(), grid,
+                                     by="team_id"))
+    """
+    for key, heatmap in heatmaps.items():
+        if key in store:
+            store[key] = store[key] + heatmap
+        else:
+            store[key] = heatmap
+    return store
+
+
+def plot_heatmap(heatmap, axis, values="counts", cmap="Reds", alpha=0.7):
+    """
+    Plots a heatmap on a horizontal pitch.
+
+    Arguments
+    ---------
+    heatmap : Heatmap
+        - heatmap to plot
+    axis : matplotlib.axes._subplots.AxesSubplot
+        - matplotlib axis object on which to plot the heatmap
+    values : string
+        - which values to plot, "counts", "xg_sum" or "xg_per_event",
+        default to "counts"
+    cmap : string
+        - matplotlib colormap, default to "Reds"
+    alpha : float
+        - transparency of the heatmap, default to 0.7
+
+    Returns
+    -------
+    matplotlib.axes._subplots.AxesSubplot
+        - axis object on which plot was produced
+    """
+    assert values in ("counts", "xg_sum", "xg_per_event"), \
+        "values must be one of 'counts', 'xg_sum' or 'xg_per_event'"
+
+    if values == "xg_per_event":
+        grid_values = heatmap.xg_per_event()
+    else:
+        grid_values = getattr(heatmap, values)
+
+    axis.pcolormesh(heatmap.grid.x_edges, heatmap.grid.y_edges,
+                    grid_values.T, cmap=cmap, alpha=alpha)
+    draw_pitch(axis, rotate=True)
+
+    return axis
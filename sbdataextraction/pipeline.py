@@ -0,0 +1,170 @@
+import os
+import pandas as pd
+from sbdataextraction import sbdataextraction as sbd
+
+PIPELINE_TABLES = ("shots", "events")
+
+
+class CSVSink:
+    """
+    Output sink for run_league_pipeline(), which appends every chunk of a
+    table to the csv file <output_dir>/<table>.csv.
+
+    Any object with a write(table, df) method can be used as a sink instead,
+    e.g. to write chunks to a database.
+    """
+
+    def __init__(self, output_dir):
+        self.output_dir = output_dir
+        self._started = set()
+        os.makedirs(output_dir, exist_ok=True)
+
+    def write(self, table, df):
+        """
+        Appends a chunk of rows to a table's csv file. The file is
+        overwritten by the first chunk written to it by this sink.
+
+        Arguments
+        ---------
+        table : string
+            - name of the table, e.g. "shots" or "events"
+        df : pandas.DataFrame
+            - chunk of rows to write
+
+        Returns
+        -------
+        None
+        """
+        path = os.path.join(self.output_dir, f"{table}.csv")
+        first_chunk = table not in self._started
+        df.to_csv(path, mode="w" if first_chunk else "a", header=first_chunk)
+        self._started.add(table)
+
+
+def _flush_chunk(buffers, sink, rows_written):
+    """
+    Helper function for run_league_pipeline().
+    Writes the buffered data frames of every table to the sink as one chunk
+    per table, and empties the buffers.
+    """
+    for table, dfs in buffers.items():
+        dfs = [df for df in dfs if len(df) > 0]
+        if dfs:
+            chunk = pd.concat(dfs)
+            sink.write(table, chunk)
+            rows_written[table] += len(chunk)
+        buffers[table] = []
+
+
+def run_league_pipeline(competition_id, sink, season_ids=None,
+                        tables=PIPELINE_TABLES, chunk_size=20,
+                        memory_budget=64*2**20, checkpoint_dir=None,
+                        cache=None, geometry_features=False, max_retries=3,
+                        backoff_factor=1.0, timeout=30, verbose=True):
+    """
+    Extracts the shots and events of every game of a league, one game at a
+    time, and writes them to an output sink in chunks. Unlike
+    fetch_seasons_for_league() followed by get_shots_for_league(), the raw
+    event data of a game is dropped as soon as it has been extracted, so
+    peak memory does not grow with the number of seasons.
+
+    Arguments
+    ---------
+    competition_id : int
+        - competition id as specified by Statsbomb
+    sink : CSVSink
+        - where chunks are written. Any object with a write(table, df)
+        method can be used
+    season_ids : list of ints
+        - only process these seasons, default to None (every season)
+    tables : tuple of strings
+        - which tables to extract, any of "shots" (the output of
+        Game.get_shots_for_game()) and "events" (the output of
+        Game.get_events_for_game()). Default to both
+    chunk_size : int
+        - maximum number of games buffered before a chunk is written,
+        default to 20
+    memory_budget : int
+        - maximum number of bytes of extracted rows buffered before a chunk
+        is written, default to 64MB
+    checkpoint_dir : string
+        - see fetch_seasons_for_league(), default to None
+    cache : sbdataextraction.cache.DerivedCache
+        - on-disk cache of extracted data frames, default to None
+    geometry_features : bool
+        - if set to True, adds shot geometry columns to the shots table,
+        see Game.get_shots_for_game(). Default to False
+    max_retries : int
+        - number of times a failed request is retried, default to 3
+    backoff_factor : float
+        - seconds to wait before the first retry, doubled on each following
+        retry, default to 1.0
+    timeout : float
+        - seconds to wait for the server before a request times out and is
+        retried, default to 30
+    verbose : bool
+        - if set to True, prints progress, default to True
+
+    Returns
+    -------
+    dict
+        - mapping of table names to the number of rows written
+
+    Examples
+    --------
+    run_league_pipeline(11, CSVSink("la_liga"), chunk_size=50)
+    """
+    assert set(tables) <= set(PIPELINE_TABLES), \
+        f"tables must be a subset of {PIPELINE_TABLES}"
+    assert chunk_size >= 1, "chunk_size must be at least 1"
+
+    all_seasons_id = sbd._get_league_seasons(competition_id, max_retries,
+                                             backoff_factor,
+                                             checkpoint_dir=checkpoint_dir,
+                                             timeout=timeout)
+    if season_ids is not None:
+        all_seasons_id = {season_name: season_id
+                          for season_name, season_id in all_seasons_id.items()
+                          if season_id in season_ids}
+
+    buffers = {table: [] for table in tables}
+    rows_written = {table: 0 for table in tables}
+    buffered_games = 0
+    buffered_bytes = 0
+
+    for season_name, season_id in all_seasons_id.items():
+        if verbose:
+            print(f"Processing season {season_name}...")
+        games = sbd.iter_matches_for_season(competition_id, season_id,
+                                            checkpoint_dir=checkpoint_dir,
+                                            max_retries=max_retries,
+                                            backoff_factor=backoff_factor,
+                                            timeout=timeout)
+        for game_id, game in games:
+            for table in tables:
+                if table == "shots":
+                    df = game.get_shots_for_game(
+                        cache=cache, geometry_features=geometry_features)
+                else:
+                    df = game.get_events_for_game(cache=cache)
+                df["game_id"] = game_id
+                df["season_id"] = season_name
+                buffers[table].append(df)
+                buffered_bytes += df.memory_usage(deep=True).sum()
+
+            # drop the raw event data before fetching the next game
+            del game
+            buffered_games += 1
+
+            if buffered_games >= chunk_size or \
+               buffered_bytes >= memory_budget:
+                _flush_chunk(buffers, sink, rows_written)
+                buffered_games = 0
+                buffered_bytes = 0
+
+    _flush_chunk(buffers, sink, rows_written)
+
+    if verbose:
+        print("Done.")
+
+    return rows_written
@@ -0,0 +1,194 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+import pandas as pd
+from sbdataextraction import sbdataextraction as sbd
+from sbdataextraction.sbdataextraction import Game
+
+IMAGE_FORMATS = ("png", "svg")
+
+# figure and axis reused by every image rendered in a worker process
+_worker_figure = None
+
+
+def _init_worker(figsize, dpi):
+    """
+    Helper function for the bulk renderers.
+    Creates the figure reused by a worker process. The figure is attached
+    directly to an Agg canvas, so no GUI backend or pyplot state is needed.
+    """
+    from matplotlib.figure import Figure
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+    global _worker_figure
+    fig = Figure(figsize=figsize, dpi=dpi)
+    FigureCanvasAgg(fig)
+    _worker_figure = (fig, fig.add_subplot(1, 1, 1))
+
+
+def _render_task(task):
+    """
+    Helper function for the bulk renderers.
+    Renders one shot or event on the worker's figure and saves it.
+    """
+    kind, item_id, payload, path = task
+    fig, axis = _worker_figure
+    axis.clear()
+    if kind == "shot":
+        sbd._plot_shot_event(payload, axis)
+    else:
+        sbd.draw_pitch(axis, rotate=True)
+        sbd._plot_event_locations(*payload, axis)
+    fig.savefig(path)
+    return item_id, path
+
+
+def _game_lookup(games):
+    """
+    Helper function for export_shot_images().
+    Converts a Game object, a season dictionary or a league dictionary to a
+    mapping of game id's to Game objects.
+    """
+    if isinstance(games, Game):
+        return {None: games}
+    lookup = {}
+    for key, value in games.items():
+        if isinstance(value, dict):
+            lookup.update(value)
+        else:
+            lookup[key] = value
+    return lookup
+
+
+def _run_tasks(tasks, output_dir, processes, figsize, dpi, chunksize):
+    """
+    Helper function for the bulk renderers.
+    Renders tasks across a pool of worker processes, and writes and returns
+    a manifest of the images produced.
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    with ProcessPoolExecutor(max_workers=processes,
+                             initializer=_init_worker,
+                             initargs=(figsize, dpi)) as executor:
+        rendered = list(executor.map(_render_task, tasks,
+                                     chunksize=chunksize))
+
+    manifest = pd.DataFrame(rendered, columns=["id", "path"])
+    manifest.to_csv(os.path.join(output_dir, "manifest.csv"), index=False)
+    return manifest
+
+
+def export_shot_images(shot_df, games, output_dir, fmt="png",
+                       processes=None, figsize=(15, 10), dpi=100,
+                       chunksize=16):
+    """
+    Renders the freeze frame of every shot in a shot data frame to an image
+    file, using a pool of worker processes. Equivalent to calling
+    plot_shot_freeze_frame() for every shot, but without a display and
+    across all cores.
+
+    Arguments
+    ---------
+    shot_df : pandas.DataFrame
+        - shots to render, indexed by shot id. Should be the output of
+        Game.get_shots_for_game(), get_shots_for_season() or
+        get_shots_for_league()
+    games : Game or dict
+        - the game object, season dictionary or league dictionary the shots
+        were extracted from. Shots are looked up by the "game_id" column of
+        shot_df, if it has one
+    output_dir : string
+        - directory in which images and manifest.csv are written
+    fmt : string
+        - image format, "png" or "svg", default to "png"
+    processes : int
+        - number of worker processes, default to None (one per core)
+    figsize : tuple
+        - figure size in inches, default to (15, 10)
+    dpi : int
+        - resolution of the images, default to 100
+    chunksize : int
+        - number of shots sent to a worker at once, default to 16
+
+    Returns
+    -------
+    pandas.DataFrame
+        - manifest with the shot id and image path of every rendered shot,
+        also written to output_dir/manifest.csv
+
+    Examples
+    --------
+    league_43 = fetch_seasons_for_league(43)
+    shot_df = get_shots_for_league(league_43)
+    export_shot_images(shot_df, league_43, "shot_images")
+    """
+    assert fmt in IMAGE_FORMATS, f"fmt must be one of {IMAGE_FORMATS}"
+
+    lookup = _game_lookup(games)
+    game_ids = [None]
+    if "game_id" in shot_df.columns:
+        game_ids = shot_df["game_id"].unique()
+
+    # raw shot events of every game, so that workers only receive the
+    # events they need to plot
+    shot_events = {}
+    for game_id in game_ids:
+        assert game_id in lookup, f"Cannot find game id {game_id} in games"
+        for events in lookup[game_id].json_file:
+            if events['type']['name'] == 'Shot':
+                shot_events[events['id']] = events
+
+    tasks = []
+    for shot_id in shot_df.index:
+        assert shot_id in shot_events, f"Cannot find shot id {shot_id}"
+        tasks.append(("shot", shot_id, shot_events[shot_id],
+                      os.path.join(output_dir, f"{shot_id}.{fmt}")))
+
+    return _run_tasks(tasks, output_dir, processes, figsize, dpi, chunksize)
+
+
+def export_event_images(event_df, output_dir, fmt="png", processes=None,
+                        figsize=(15, 10), dpi=100, chunksize=16):
+    """
+    Renders every event in an event data frame to an image file, using a
+    pool of worker processes. Equivalent to calling plot_event() for every
+    event on a pitch, but without a display and across all cores.
+
+    Arguments
+    ---------
+    event_df : pandas.DataFrame
+        - events to render, indexed by event id. Should be the output of
+        Game.get_events_for_game()
+    output_dir : string
+        - directory in which images and manifest.csv are written
+    fmt : string
+        - image format, "png" or "svg", default to "png"
+    processes : int
+        - number of worker processes, default to None (one per core)
+    figsize : tuple
+        - figure size in inches, default to (15, 10)
+    dpi : int
+        - resolution of the images, default to 100
+    chunksize : int
+        - number of events sent to a worker at once, default to 16
+
+    Returns
+    -------
+    pandas.DataFrame
+        - manifest with the event id and image path of every rendered event,
+        also written to output_dir/manifest.csv
+
+    Examples
+    --------
+    event_df = game.get_events_for_game()
+    export_event_images(event_df, "event_images", fmt="svg")
+    """
+    assert fmt in IMAGE_FORMATS, f"fmt must be one of {IMAGE_FORMATS}"
+
+    columns = ["event name", "x start location", "y start location",
+               "x end location", "y end location"]
+    tasks = [("event", event_id, tuple(row),
+              os.path.join(output_dir, f"{event_id}.{fmt}"))
+             for event_id, row in zip(event_df.index,
+                                      event_df[columns].values.tolist())]
+
+    return _run_tasks(tasks, output_dir, processes, figsize, dpi, chunksize)
@@ -1,34 +1,121 @@
 import requests
+import hashlib
 import json
+import os
 import sys
+import time
 import pandas as pd
 import numpy as np
+from sbdataextraction import geometry
+from sbdataextraction.urls import COMPETITIONS_URL, MATCHES_URL, EVENTS_URL
+
+# Versions of the shot and event extraction code. Bump these whenever the
+# output of get_shots_for_game() or get_events_for_game() changes, so that
+# data frames cached by an older version are not reused.
+SHOT_EXTRACTOR_VERSION = 3
+EVENT_EXTRACTOR_VERSION = 1
+
+# HTTP status codes, other than 5xx server errors, worth retrying
+RETRY_STATUS_CODES = (408, 429)
 
 
 class Game:
     """
     Game object with json_file attribute, which is the event data for
     a game as a JSON file (from Statsbomb public data) pre-loaded into python.
+    The payload attribute holds the raw JSON file as bytes, exactly as it was
+    downloaded. The match_id attribute is the Statsbomb game id, if known,
+    and payload_hash is a hash of the payload, used to key cached shot and
+    event data frames.
+
+    The payload is only parsed into json_file when json_file is first
+    accessed, so getting shots or events from a DerivedCache does not parse
+    the game at all.
     """
 
-    def __init__(self, json_file):
-        self.json_file = json.loads(json_file)
+    def __init__(self, json_file, match_id=None):
+        if isinstance(json_file, str):
+            json_file = json_file.encode("utf-8")
+        self.payload = json_file
+        self.match_id = match_id
+        self.payload_hash = hashlib.sha1(json_file).hexdigest()
+        self._json_file = None
+        self._derived = {}
+
+    @property
+    def json_file(self):
+        if self._json_file is None:
+            self._json_file = self._parse_payload()
+        return self._json_file
+
+    @json_file.setter
+    def json_file(self, json_file):
+        self._json_file = json_file
+
+    def _parse_payload(self):
+        """
+        Helper function for the json_file property.
+        Parses the raw payload into a list of event dictionaries.
+        """
+        return json.loads(self.payload)
+
+    def _get_derived(self, kind, version, cache):
+        """
+        Helper function for get_shots_for_game() and get_events_for_game().
+        Returns a previously extracted data frame from the Game object's
+        in-memory cache, or from the on-disk cache if one is given,
+        or None if it has not been extracted yet.
+        """
+        df = self._derived.get((kind, version))
+        if df is None and cache is not None:
+            df = cache.get(kind, self.match_id, self.payload_hash, version)
+            if df is not None:
+                self._derived[(kind, version)] = df
+        return df
+
+    def _put_derived(self, kind, version, cache, df):
+        """
+        Helper function for get_shots_for_game() and get_events_for_game().
+        Saves an extracted data frame to the Game object's in-memory cache,
+        and to the on-disk cache if one is given.
+        """
+        self._derived[(kind, version)] = df
+        if cache is not None:
+            cache.put(kind, self.match_id, self.payload_hash, version, df)
 
-    def get_shots_for_game(self):
+    def get_shots_for_game(self, cache=None, geometry_features=False):
         """
         Parses through Game object's json_file and returns a data frame
         containing all shots taken in that game with several features related
         to the shots.
 
+        The data frame is only computed once per Game object, and can also
+        be persisted across runs by passing in a DerivedCache.
+
         Arguments
         ---------
-        None
+        cache : sbdataextraction.cache.DerivedCache
+            - on-disk cache of extracted data frames, default to None
+        geometry_features : bool
+            - if set to True, adds the "distance to goal", "shot angle" and
+            "goal blocked fraction" columns (see sbdataextraction.geometry).
+            The blocked fraction is the fraction of the goal mouth hidden
+            behind opponents other than the goalkeeper in the shot's freeze
+            frame (the same opponents as in "num opponents between shot and
+            goal"), and is NaN for shots without a freeze frame.
+            Default to False
 
         Returns
         -------
         pandas.DataFrame
             - Data frame containing shots and features
         """
+        kind = "shots_geometry" if geometry_features else "shots"
+        shot_df = self._get_derived(kind, SHOT_EXTRACTOR_VERSION, cache)
+        if shot_df is not None:
+            self.shot_df = shot_df
+            return shot_df.copy()
+
         # features for each shot, which will be the columns of our data frame
         feature_list = ["shot id", "team_id", "team_name", "player_id",
                         "player_name", "play pattern", "x start location",
@@ -39,6 +126,14 @@ class Game:
 
         features = []
 
+        # flattened freeze frames of opponents, for the vectorized
+        # between shot and goal check and the geometry features
+        frame_shot_index = []
+        frame_x = []
+        frame_y = []
+        frame_gk = []
+        has_frame = []
+
         for events in self.json_file:
 
             if events['type']['name'] == 'Shot':
@@ -66,15 +161,22 @@ class Game:
                     first_time = False
 
                 # check if shot has a freeze_frame dictionary
-                if "freeze_frame" in events["shot"]:
+                has_frame.append("freeze_frame" in events["shot"])
+                if has_frame[-1]:
 
                     num_opponents_5_yards = 0
-                    num_opponents_between_goal = 0
 
                     for player in events["shot"]["freeze_frame"]:
                         x_player = player['location'][0]
                         y_player = player['location'][1]
 
+                        if not player['teammate']:
+                            frame_shot_index.append(len(features))
+                            frame_x.append(x_player)
+                            frame_y.append(y_player)
+                            frame_gk.append(player['position']['name'] ==
+                                            'Goalkeeper')
+
                         # count how many opponents were within 5yards of player
                         # when shot was taken
                         x_dist = (x_start - x_player)**2
@@ -83,15 +185,6 @@ class Game:
                             if (player['position']['name'] != 'Goalkeeper'):
                                 num_opponents_5_yards += 1
 
-                        # count how many opponents were between shot and goal
-                        if (not player['teammate']) and \
-                           (player['position']['name'] != 'Goalkeeper'):
-                            if self.check_player_btwn_shot_and_goal(x_start,
-                                                                    y_start,
-                                                                    x_player,
-                                                                    y_player):
-                                num_opponents_between_goal += 1
-
                         # get position of opponent's goalkeeper
                         if (player['position']['name'] == 'Goalkeeper') and \
                            (not player['teammate']):
@@ -101,7 +194,6 @@ class Game:
                 # if there is no freeze frame, assume goalkeeper is at
                 # center of goal, and 0 opponenets around shot location
                 else:
-                    num_opponents_between_goal = 0
                     num_opponents_5_yards = 0
                     x_gk_pos = 120
                     y_gk_pos = 40
@@ -110,16 +202,40 @@ class Game:
                                  player_name, play_pattern, x_start, y_start,
                                  duration, outcome, technique, first_time,
                                  x_gk_pos, y_gk_pos, type_shot,
-                                 num_opponents_5_yards,
-                                 num_opponents_between_goal, xg])
+                                 num_opponents_5_yards, 0, xg])
 
         # create data frame
         shot_df = pd.DataFrame(features,
                                columns=feature_list).set_index("shot id")
 
+        # count how many opponents, other than the goalkeeper, were between
+        # shot and goal, for all shots at once
+        x_shot = shot_df["x start location"].values.astype(float)
+        y_shot = shot_df["y start location"].values.astype(float)
+        frame_shot_index = np.asarray(frame_shot_index, dtype=int)
+        frame_gk = np.asarray(frame_gk, dtype=bool)
+        if geometry_features:
+            shot_geometry = geometry.shot_geometry(
+                x_shot, y_shot, frame_shot_index, frame_x, frame_y,
+                is_goalkeeper=frame_gk, has_frame=has_frame)
+            between = shot_geometry["between"]
+        else:
+            between = geometry.between_shot_and_goal(
+                x_shot[frame_shot_index], y_shot[frame_shot_index],
+                frame_x, frame_y)
+        shot_df["num opponents between shot and goal"] = np.bincount(
+            frame_shot_index[~frame_gk & between], minlength=len(shot_df))
+
+        if geometry_features:
+            shot_df["distance to goal"] = shot_geometry["distance"]
+            shot_df["shot angle"] = shot_geometry["angle"]
+            shot_df["goal blocked fraction"] = \
+                shot_geometry["blocked fraction"]
+
+        self._put_derived(kind, SHOT_EXTRACTOR_VERSION, cache, shot_df)
         self.shot_df = shot_df
 
-        return shot_df
+        return shot_df.copy()
 
     def check_player_btwn_shot_and_goal(self, xshot, yshot, xplayer, yplayer):
         """
@@ -151,7 +267,7 @@ class Game:
         btwn = (yshot + slope_1*x_diff) < yplayer < (yshot + slope_2*x_diff)
         return (x_diff >= 0) and btwn
 
-    def get_events_for_game(self):
+    def get_events_for_game(self, cache=None):
         """
         Parses through Game object's json_file and returns a data frame
         containing all all shots, passes, ball receipts and carries performed
@@ -163,9 +279,13 @@ class Game:
             - y end location (-1 if event is a shot)
             - xg (-1 if event is not a shot)
 
+        The data frame is only computed once per Game object, and can also
+        be persisted across runs by passing in a DerivedCache.
+
         Arguments
         ---------
-        None
+        cache : sbdataextraction.cache.DerivedCache
+            - on-disk cache of extracted data frames, default to None
 
         Returns
         -------
@@ -174,6 +294,11 @@ class Game:
             carries performed in the specified game with several features
             related to those events
         """
+        events_df = self._get_derived("events", EVENT_EXTRACTOR_VERSION,
+                                      cache)
+        if events_df is not None:
+            self.event_df = events_df
+            return events_df.copy()
 
         feature_list = ["event id", "time", "event name", "team_id",
                         "team_name", "player_id", "player_name",
@@ -211,7 +336,7 @@ class Game:
                     xg = -1
 
                 if "related_events" in events.keys():
-                    related = events["related_events"]
+                    related = list(events["related_events"])
                     is_pass = (event_name == "pass")
                     if is_pass and "assisted_shot_id" in events["pass"].keys(): # noqa
                         related.append(events["pass"]["assisted_shot_id"])
@@ -226,12 +351,254 @@ class Game:
         events_df = pd.DataFrame(features,
                                  columns=feature_list).set_index("event id")
 
+        self._put_derived("events", EVENT_EXTRACTOR_VERSION, cache,
+                          events_df)
         self.event_df = events_df
 
-        return events_df
+        return events_df.copy()
+
+
+def _get_with_retry(url, max_retries=3, backoff_factor=1.0, timeout=30):
+    """
+    Helper function for the fetch functions.
+    Gets the text of a webpage, retrying failed requests with exponential
+    backoff (backoff_factor, 2*backoff_factor, 4*backoff_factor... seconds).
+    Only transient failures are retried: connection errors, timeouts, and
+    responses with a status code in RETRY_STATUS_CODES or of 500 and above.
+    Other errors (e.g. 404 for a missing match) are raised immediately.
+
+    Arguments
+    ---------
+    url : string
+        - url to fetch
+    max_retries : int
+        - number of times a failed request is retried before giving up
+    backoff_factor : float
+        - number of seconds to wait before the first retry
+    timeout : float
+        - number of seconds to wait for the server to connect or send data
+        before the request is failed (and retried) with a timeout
+
+    Returns
+    -------
+    string
+        - text of the webpage
+    """
+    for attempt in range(max_retries + 1):
+        try:
+            response = requests.get(url, timeout=timeout)
+        except (requests.exceptions.ConnectionError,
+                requests.exceptions.Timeout):
+            if attempt == max_retries:
+                raise
+        else:
+            transient = response.status_code in RETRY_STATUS_CODES or \
+                response.status_code >= 500
+            if not transient or attempt == max_retries:
+                response.raise_for_status()
+                return response.text
+        time.sleep(backoff_factor * 2**attempt)
+
+
+def _read_checkpoint(path):
+    """
+    Helper function for the fetch functions.
+    Returns the text stored at path, or None if it has not been
+    checkpointed yet.
+    """
+    if path is None or not os.path.exists(path):
+        return None
+    with open(path, "r", encoding="utf-8") as f:
+        return f.read()
+
+
+def _write_checkpoint(path, text):
+    """
+    Helper function for the fetch functions.
+    Writes text to path atomically, so that an interrupted write never
+    leaves a truncated checkpoint behind.
+    """
+    if path is None:
+        return
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        f.write(text)
+    os.replace(tmp_path, path)
+
+
+def _get_checkpointed(url, path, max_retries, backoff_factor, timeout):
+    """
+    Helper function for the fetch functions.
+    Returns the checkpointed text at path if it exists, otherwise fetches url
+    and checkpoints the result to path.
+    """
+    text = _read_checkpoint(path)
+    if text is None:
+        text = _get_with_retry(url, max_retries=max_retries,
+                               backoff_factor=backoff_factor,
+                               timeout=timeout)
+        _write_checkpoint(path, text)
+    return text
+
+
+def _get_refreshed(url, path, max_retries, backoff_factor, timeout):
+    """
+    Helper function for the fetch functions.
+    Fetches url and checkpoints the result to path. If the request fails,
+    falls back to the text checkpointed at path by a previous run, if any.
+    """
+    try:
+        text = _get_with_retry(url, max_retries=max_retries,
+                               backoff_factor=backoff_factor,
+                               timeout=timeout)
+    except requests.exceptions.RequestException:
+        text = _read_checkpoint(path)
+        if text is None:
+            raise
+        return text
+    _write_checkpoint(path, text)
+    return text
+
+
+def _get_season_game_ids(competition_id, season_id, checkpoint_dir,
+                         max_retries, backoff_factor, timeout):
+    """
+    Helper function for the fetch functions.
+    Returns the checkpoint directory of a season (None if checkpoint_dir is
+    None) and the list of game id's in that season.
+    The match list is downloaded again on every run, so that reruns pick up
+    games played since the last run, and only read from the checkpoint if
+    the download fails.
+    """
+    season_dir = None
+    matches_path = None
+    if checkpoint_dir is not None:
+        season_dir = os.path.join(checkpoint_dir, str(competition_id),
+                                  str(season_id))
+        matches_path = os.path.join(season_dir, "matches.json")
+
+    req = _get_refreshed(MATCHES_URL + f"/{competition_id}" +
+                         f"/{season_id}.json", matches_path,
+                         max_retries, backoff_factor, timeout)
+    season_json = json.loads(req)
+
+    return season_dir, [game['match_id'] for game in season_json]
+
+
+def _fetch_game(game_num, season_dir, max_retries, backoff_factor, timeout,
+                intern_table=None):
+    """
+    Helper function for the fetch functions.
+    Returns a Game object for the specified game id, loaded from the season's
+    checkpoint directory if it was checkpointed, downloaded otherwise.
+    If intern_table is not None, returns a CompactGame sharing that intern
+    table instead.
+    """
+    game_path = None
+    if season_dir is not None:
+        game_path = os.path.join(season_dir, f"{game_num}.json")
+    game_text = _get_checkpointed(EVENTS_URL + f"/{game_num}.json",
+                                  game_path, max_retries, backoff_factor,
+                                  timeout)
+    if intern_table is not None:
+        from sbdataextraction.compact import CompactGame
+        return CompactGame(game_text, match_id=game_num,
+                           intern_table=intern_table)
+    return Game(game_text, match_id=game_num)
+
+
+def _get_competitions(checkpoint_dir, max_retries, backoff_factor,
+                      timeout):
+    """
+    Helper function for the fetch functions.
+    Returns the parsed competitions.json. Like the match lists, it is
+    downloaded again on every run and only read from checkpoint_dir (if not
+    None) when the download fails, so that checkpointed runs can be resumed
+    offline.
+    """
+    competitions_path = None
+    if checkpoint_dir is not None:
+        competitions_path = os.path.join(checkpoint_dir, "competitions.json")
+
+    # Get webpage html for competitions.json
+    req = _get_refreshed(COMPETITIONS_URL, competitions_path, max_retries,
+                         backoff_factor, timeout)
+    # Convert webpage to json format
+    return json.loads(req)
+
+
+def _get_league_seasons(competition_id, max_retries, backoff_factor,
+                        checkpoint_dir=None, timeout=30):
+    """
+    Helper function for the fetch functions.
+    Returns a mapping of season names to season id's for the specified
+    competition id.
+    """
+    competitions_statsbomb = _get_competitions(checkpoint_dir, max_retries,
+                                               backoff_factor, timeout)
+
+    comp_id_list = np.unique([x['competition_id'] for x in competitions_statsbomb]) # noqa
+    assert competition_id in comp_id_list, \
+        f"""competition id must be one of {comp_id_list}.
+        See here: https://github.com/statsbomb/open-data/blob/master/data/competitions.json" """ # noqa
+
+    all_seasons_id = {}
+    for comps in competitions_statsbomb:
+        if comps['competition_id'] == competition_id:
+            season_id = comps['season_id']
+            season_name = comps['season_name']
+
+            all_seasons_id[season_name] = season_id
+
+    return all_seasons_id
+
+
+def iter_matches_for_season(competition_id, season_id, checkpoint_dir=None,
+                            max_retries=3, backoff_factor=1.0, timeout=30):
+    """
+    Takes a competition id and season id as specified by Statsbomb, and
+    yields the games of that season one at a time. Unlike
+    fetch_matches_for_season(), only one game is held in memory at once.
+
+    Arguments
+    ---------
+    competition_id : int
+        - competition id as specified by Statsbomb
+    season_id : int
+        - season id as specified by Statsbomb
+    checkpoint_dir : string
+        - see fetch_matches_for_season(), default to None
+    max_retries : int
+        - number of times a failed request is retried, default to 3
+    backoff_factor : float
+        - seconds to wait before the first retry, doubled on each following
+        retry, default to 1.0
+    timeout : float
+        - seconds to wait for the server before a request times out and is
+        retried, default to 30
+
+    Yields
+    ------
+    tuple
+        - game id and 'Game' object for each game of the season
+
+    Examples
+    --------
+    for game_id, game in iter_matches_for_season(11, 37):
+        game.get_shots_for_game()
+    """
+    season_dir, game_nums = _get_season_game_ids(competition_id, season_id,
+                                                 checkpoint_dir, max_retries,
+                                                 backoff_factor, timeout)
+    for game_num in game_nums:
+        yield game_num, _fetch_game(game_num, season_dir, max_retries,
+                                    backoff_factor, timeout)
 
 
-def fetch_matches_for_season(competition_id, season_id, verbose=True):
+def fetch_matches_for_season(competition_id, season_id, verbose=True,
+                             checkpoint_dir=None, max_retries=3,
+                             backoff_factor=1.0, timeout=30, compact=False):
     """
     Takes a competition id and season id as specified by Statsbomb,
     and returns a dictionary maping game id's to the game's
@@ -245,6 +612,27 @@ def fetch_matches_for_season(competition_id, season_id, verbose=True):
     season_id : int
         - season id as specified by Statsbomb
         See here: https://github.com/statsbomb/open-data/blob/master/data/competitions.json # noqa
+    verbose : bool
+        - if set to True, prints a progress bar, default to True
+    checkpoint_dir : string
+        - directory in which the competition list, the season's match list
+        and each finished game's event data are saved as they are
+        downloaded. If the function is rerun with the same directory,
+        checkpointed games are loaded from disk instead of being downloaded
+        again. The competition and match lists themselves are downloaded
+        again, so that new games are picked up, and only read from disk if
+        the download fails. Default to None (no checkpointing)
+    max_retries : int
+        - number of times a failed request is retried, default to 3
+    backoff_factor : float
+        - seconds to wait before the first retry, doubled on each following
+        retry, default to 1.0
+    timeout : float
+        - seconds to wait for the server before a request times out and is
+        retried, default to 30
+    compact : bool
+        - if set to True, games are CompactGame objects, which use much less
+        memory (see sbdataextraction.compact), default to False
 
     Returns
     -------
@@ -255,12 +643,10 @@ def fetch_matches_for_season(competition_id, season_id, verbose=True):
     Examples
     --------
     fetch_matches_for_season(11, 21)
+    fetch_matches_for_season(11, 21, checkpoint_dir="statsbomb_data")
     """
-    # Get webpage html for competitions.json
-    comp_url = "https://raw.githubusercontent.com/statsbomb/open-data/master/data/competitions.json" # noqa
-    req = requests.get(comp_url).text
-    # Convert webpage to json format
-    competitions_statsbomb = json.loads(req)
+    competitions_statsbomb = _get_competitions(checkpoint_dir, max_retries,
+                                               backoff_factor, timeout)
     comp_id_list = np.unique([x['competition_id'] for x in competitions_statsbomb]) # noqa
     season_id_list = np.unique([x['season_id'] for x in competitions_statsbomb]) # noqa
     assert competition_id in comp_id_list, \
@@ -270,21 +656,20 @@ def fetch_matches_for_season(competition_id, season_id, verbose=True):
         f"""season id must be one of {season_id_list}.
         See here: https://github.com/statsbomb/open-data/blob/master/data/competitions.json" """ # noqa
 
-    base = "https://raw.githubusercontent.com/statsbomb/open-data/master/data/matches" # noqa
-    req = requests.get(base + f"/{competition_id}" + f"/{season_id}.json").text
-    season_json = json.loads(req)
-
-    game_nums = [game['match_id'] for game in season_json]
+    season_dir, game_nums = _get_season_game_ids(competition_id, season_id,
+                                                 checkpoint_dir, max_retries,
+                                                 backoff_factor, timeout)
 
-    base_url_string = "https://raw.githubusercontent.com/statsbomb/open-data/master/data/events/" # noqa
+    intern_table = {} if compact else None
     game_num_dict = {}
     if verbose:
         print(f"Fetching matches for season_id {season_id} " +
               f"of competition_id {competition_id}...")
     for i, game_num in enumerate(game_nums):
-        game_num_dict[game_num] = Game(requests.get(base_url_string +
-                                                    str(game_num) +
-                                                    ".json").text)
+        game_num_dict[game_num] = _fetch_game(game_num, season_dir,
+                                              max_retries, backoff_factor,
+                                              timeout,
+                                              intern_table=intern_table)
         if verbose:
             sys.stdout.write('\r')
             sys.stdout.write(f"[%-{len(game_nums)-1}s] %d%%"
@@ -296,7 +681,9 @@ def fetch_matches_for_season(competition_id, season_id, verbose=True):
     return game_num_dict
 
 
-def fetch_seasons_for_league(competition_id, verbose=True):
+def fetch_seasons_for_league(competition_id, verbose=True,
+                             checkpoint_dir=None, max_retries=3,
+                             backoff_factor=1.0, timeout=30, compact=False):
     """
     Takes a competition id as specified by Statsbomb, and returns a dictionary
     mapping season id's to inner dictionaries, which themselves map game id's
@@ -307,6 +694,25 @@ def fetch_seasons_for_league(competition_id, verbose=True):
     competition_id : int
         - competition id as specified by Statsbomb
         See here: https://github.com/statsbomb/open-data/blob/master/data/competitions.json # noqa
+    verbose : bool
+        - if set to True, prints a progress bar, default to True
+    checkpoint_dir : string
+        - directory in which the competition list, the match lists and
+        every finished game of every season are saved. If the fetch is
+        interrupted (e.g. by a network error), rerunning it with the same
+        directory resumes from the last checkpointed game, even without a
+        network connection. Default to None (no checkpointing)
+    max_retries : int
+        - number of times a failed request is retried, default to 3
+    backoff_factor : float
+        - seconds to wait before the first retry, doubled on each following
+        retry, default to 1.0
+    timeout : float
+        - seconds to wait for the server before a request times out and is
+        retried, default to 30
+    compact : bool
+        - if set to True, games are CompactGame objects, which use much less
+        memory (see sbdataextraction.compact), default to False
 
     Returns
     -------
@@ -318,33 +724,25 @@ def fetch_seasons_for_league(competition_id, verbose=True):
     Examples
     --------
     fetch_seasons_for_league(11)
+    fetch_seasons_for_league(11, checkpoint_dir="statsbomb_data")
 
     """
-    # Get webpage html for competitions.json
-    comp_url = "https://raw.githubusercontent.com/statsbomb/open-data/master/data/competitions.json" # noqa
-    req = requests.get(comp_url).text
-    # Convert webpage to json format
-    competitions_statsbomb = json.loads(req)
-
-    comp_id_list = np.unique([x['competition_id'] for x in competitions_statsbomb]) # noqa
-    assert competition_id in comp_id_list, \
-        f"""competition id must be one of {comp_id_list}.
-        See here: https://github.com/statsbomb/open-data/blob/master/data/competitions.json" """ # noqa
-
-    all_seasons_id = {}
-    for comps in competitions_statsbomb:
-        if comps['competition_id'] == competition_id:
-            season_id = comps['season_id']
-            season_name = comps['season_name']
-
-            all_seasons_id[season_name] = season_id
+    all_seasons_id = _get_league_seasons(competition_id, max_retries,
+                                         backoff_factor,
+                                         checkpoint_dir=checkpoint_dir,
+                                         timeout=timeout)
 
     all_games_by_seasons = {}
     print(f"Matches will be fetched for {len(all_seasons_id)} seasons.")
     for season_name, season_id in all_seasons_id.items():
         season = fetch_matches_for_season(competition_id,
                                           season_id,
-                                          verbose=verbose)
+                                          verbose=verbose,
+                                          checkpoint_dir=checkpoint_dir,
+                                          max_retries=max_retries,
+                                          backoff_factor=backoff_factor,
+                                          timeout=timeout,
+                                          compact=compact)
         all_games_by_seasons[season_name] = season
 
     print("\n\nDone")
@@ -352,7 +750,7 @@ def fetch_seasons_for_league(competition_id, verbose=True):
     return all_games_by_seasons
 
 
-def get_shots_for_season(season_dict):
+def get_shots_for_season(season_dict, cache=None, geometry_features=False):
     """
     Fetches shot data frame for all shots taken over an entire season.
 
@@ -362,6 +760,13 @@ def get_shots_for_season(season_dict):
         - mapping of game id's to a 'Game' object with a
         json_file attribute (the event data for that game as a JSON file).
         Should be the output of the fetch_matches_for_season() function.
+    cache : sbdataextraction.cache.DerivedCache
+        - on-disk cache of extracted data frames. Games whose shots were
+        already extracted by the same version of the code are loaded from the
+        cache instead of being parsed again. Default to None
+    geometry_features : bool
+        - if set to True, adds shot geometry columns, see
+        Game.get_shots_for_game(). Default to False
 
     Returns
     -------
@@ -372,19 +777,24 @@ def get_shots_for_season(season_dict):
     --------
     season_11_37 = fetch_matches_for_season(11, 37)
     get_shots_for_season(season_11_37)
+    get_shots_for_season(season_11_37, cache=DerivedCache("shot_cache"))
 
     """
-    total_shot_df = pd.DataFrame()
+    shot_dfs = []
 
     for game_id, game_obj in season_dict.items():
-        shot_df = game_obj.get_shots_for_game()
+        shot_df = game_obj.get_shots_for_game(
+            cache=cache, geometry_features=geometry_features)
         shot_df["game_id"] = game_id
-        total_shot_df = total_shot_df.append(shot_df)
+        shot_dfs.append(shot_df)
 
-    return total_shot_df
+    if not shot_dfs:
+        return pd.DataFrame()
 
+    return pd.concat(shot_dfs)
 
-def get_shots_for_league(league_dict):
+
+def get_shots_for_league(league_dict, cache=None, geometry_features=False):
     """
     Fetches shot data frame for all shots taken in a league over many seasons.
 
@@ -395,6 +805,12 @@ def get_shots_for_league(league_dict):
         object with a json_file attribute (the event data for that game as a
         JSON file).
         Should be the output of fetch_seasons_for_league().
+    cache : sbdataextraction.cache.DerivedCache
+        - on-disk cache of extracted data frames, see get_shots_for_season().
+        Default to None
+    geometry_features : bool
+        - if set to True, adds shot geometry columns, see
+        Game.get_shots_for_game(). Default to False
 
     Returns
     -------
@@ -405,18 +821,23 @@ def get_shots_for_league(league_dict):
     --------
     league_11 = fetch_seasons_for_league(11)
     get_shots_for_league(league_11)
+    get_shots_for_league(league_11, cache=DerivedCache("shot_cache"))
     """
-    total_shot_df = pd.DataFrame()
+    shot_dfs = []
 
     for keys, values in league_dict.items():
-        shot_df = get_shots_for_season(values)
+        shot_df = get_shots_for_season(values, cache=cache,
+                                       geometry_features=geometry_features)
         shot_df["season_id"] = keys
-        total_shot_df = total_shot_df.append(shot_df)
+        shot_dfs.append(shot_df)
         print("Getting shots for " + keys)
 
     print("Done.")
 
-    return total_shot_df
+    if not shot_dfs:
+        return pd.DataFrame()
+
+    return pd.concat(shot_dfs)
 
 
 def draw_pitch(axis, rotate=False):
@@ -521,6 +942,22 @@ def plot_shot_freeze_frame(game, shot_id, axis):
     assert shot_id in game.shot_df.index, "Cannot find specified shot_id" + \
                                           "in this game's shot data frame"
 
+    shot_event = None
+    for events in game.json_file:
+        if events['id'] == shot_id:
+            shot_event = events
+            break
+
+    return _plot_shot_event(shot_event, axis)
+
+
+def _plot_shot_event(shot_event, axis):
+    """
+    Helper function for plot_shot_freeze_frame() and the bulk renderers in
+    sbdataextraction.render.
+    Plots a shot freeze frame from the shot's raw event data (a dictionary
+    from a Game object's json_file), or an empty pitch if shot_event is None.
+    """
     draw_pitch(axis=axis, rotate=True)
 
     gk_x = 120
@@ -530,21 +967,20 @@ def plot_shot_freeze_frame(game, shot_id, axis):
     x_shot = 0
     y_shot = 0
 
-    for events in game.json_file:
-        if events['id'] == shot_id:
-            x_shot = events['location'][0]
-            y_shot = events['location'][1]
+    if shot_event is not None:
+        x_shot = shot_event['location'][0]
+        y_shot = shot_event['location'][1]
 
-            if "freeze_frame" in events["shot"]:
-                for players in events['shot']['freeze_frame']:
-                    if (not players['teammate']):
-                        player_pos_list_x.append(players['location'][0])
-                        player_pos_list_y.append(players['location'][1])
+        if "freeze_frame" in shot_event["shot"]:
+            for players in shot_event['shot']['freeze_frame']:
+                if (not players['teammate']):
+                    player_pos_list_x.append(players['location'][0])
+                    player_pos_list_y.append(players['location'][1])
 
-                    if (players['position']['name'] == 'Goalkeeper') and \
-                       (not players['teammate']):
-                        gk_x = players['location'][0]
-                        gk_y = players['location'][1]
+                if (players['position']['name'] == 'Goalkeeper') and \
+                   (not players['teammate']):
+                    gk_x = players['location'][0]
+                    gk_y = players['location'][1]
 
     axis.scatter(player_pos_list_x, player_pos_list_y)
     axis.scatter(x_shot, y_shot, s=100)
@@ -584,15 +1020,27 @@ def plot_event(game, event_id, axis):
     x2 = game.event_df.loc[event_id]["x end location"]
     y1 = game.event_df.loc[event_id]["y start location"]
     y2 = game.event_df.loc[event_id]["y end location"]
+    if event_type == "shot" and "shot_df" in dir(game):
+        plot_shot_freeze_frame(game, event_id, axis)
+    else:
+        _plot_event_locations(event_type, x1, y1, x2, y2, axis)
+
+    return axis
+
+
+def _plot_event_locations(event_type, x1, y1, x2, y2, axis):
+    """
+    Helper function for plot_event() and the bulk renderers in
+    sbdataextraction.render.
+    Plots an event from its type and start and end locations, as found in
+    the event data frame returned by Game.get_events_for_game().
+    """
     if event_type == "pass":
         axis.arrow(x1, y1, dx=x2-x1, dy=y2-y1, head_width=2, head_length=2)
     elif event_type == "carry":
         axis.plot([x1, x2], [y1, y2], linestyle="--", color="black")
     elif event_type == "shot":
-        if "shot_df" in dir(game):
-            plot_shot_freeze_frame(game, event_id, axis)
-        else:
-            axis.scatter(x1, y1, marker="X", s=200)
+        axis.scatter(x1, y1, marker="X", s=200)
     elif event_type == "ball receipt*":
         axis.scatter(x1, y1, marker="*", s=200)
 
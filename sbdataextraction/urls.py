@@ -0,0 +1,6 @@
+# Locations of the Statsbomb open data. Kept separate from the rest of the
+# package so that they can be used without importing pandas, numpy or
+# requests (e.g. by the command line interface).
+COMPETITIONS_URL = "https://raw.githubusercontent.com/statsbomb/open-data/master/data/competitions.json" # noqa
+MATCHES_URL = "https://raw.githubusercontent.com/statsbomb/open-data/master/data/matches" # noqa
+EVENTS_URL = "https://raw.githubusercontent.com/statsbomb/open-data/master/data/events" # noqa
@@ -0,0 +1,61 @@
+import json
+import pytest
+
+
+def _player(x, y, teammate, position="Center Back"):
+    return {"location": [x, y], "teammate": teammate,
+            "position": {"id": 1, "name": position}}
+
+
+def _event(event_id, type_name, team, player, location, **kwargs):
+    event = {"id": event_id, "index": 1, "period": 1,
+             "timestamp": "00:10:00.000", "minute": 10, "second": 0,
+             "type": {"id": 1, "name": type_name},
+             "possession_team": {"id": team[0], "name": team[1]},
+             "team": {"id": team[0], "name": team[1]},
+             "play_pattern": {"id": 1, "name": "Regular Play"},
+             "player": {"id": player[0], "name": player[1]},
+             "location": location, "duration": 1.0}
+    event.update(kwargs)
+    return event
+
+
+BARCA = (217, "Barcelona")
+MADRID = (220, "Real Madrid")
+MESSI = (5503, "Lionel Andrés Messi Cuccittini")
+BENZEMA = (19677, "Karim Benzema")
+
+SAMPLE_EVENTS = [
+    _event("pass-1", "Pass", BARCA, MESSI, [60.0, 40.0],
+           related_events=["receipt-1"],
+           **{"pass": {"end_location": [100.0, 38.0],
+                       "assisted_shot_id": "shot-1"}}),
+    _event("receipt-1", "Ball Receipt*", BARCA, MESSI, [100.0, 38.0],
+           related_events=["pass-1"]),
+    _event("carry-1", "Carry", BARCA, MESSI, [100.0, 38.0],
+           carry={"end_location": [104.0, 40.0]}),
+    _event("shot-1", "Shot", BARCA, MESSI, [104.0, 40.0],
+           related_events=["pass-1"],
+           shot={"statsbomb_xg": 0.3, "first_time": True,
+                 "outcome": {"id": 97, "name": "Goal"},
+                 "technique": {"id": 93, "name": "Normal"},
+                 "type": {"id": 87, "name": "Open Play"},
+                 "freeze_frame": [_player(118.0, 40.0, False, "Goalkeeper"),
+                                  _player(110.0, 40.0, False),
+                                  _player(106.0, 42.0, False),
+                                  _player(101.0, 30.0, True)]}),
+    _event("shot-2", "Shot", MADRID, BENZEMA, [20.0, 50.0],
+           shot={"statsbomb_xg": 0.05,
+                 "outcome": {"id": 100, "name": "Saved"},
+                 "technique": {"id": 93, "name": "Normal"},
+                 "type": {"id": 87, "name": "Open Play"}}),
+]
+
+
+@pytest.fixture
+def sample_json():
+    """
+    Event data for a small made up game, with a pass, a ball receipt,
+    a carry, a shot with a freeze frame and a shot without one.
+    """
+    return json.dumps(SAMPLE_EVENTS)
@@ -0,0 +1,57 @@
+import pytest
+from sbdataextraction.sbdataextraction import Game
+from sbdataextraction.aggregates import ShotAggregateStore
+
+
+def test_shot_aggregate_store(sample_json):
+    # check totals after adding, re-adding and removing games
+    store = ShotAggregateStore()
+    season = {1: Game(sample_json), 2: Game(sample_json)}
+    assert store.update_from_season(season, "2004/2005") == [1, 2], \
+        """every new game of the season should be added"""
+    assert store.update_from_season(season, "2004/2005") == [], \
+        """games already in the store should not be added again"""
+
+    messi = store.get("player", 5503, "2004/2005")
+    assert messi["shots"] == 2 and messi["goals"] == 2, \
+        """player totals should add up the shots of both games"""
+    assert messi["xg"] == pytest.approx(0.6) and \
+        messi["first time share"] == 1 and \
+        messi["avg opponents between"] == 1, \
+        """player totals should include xg, first time share and
+        opponents between shot and goal"""
+    assert store.get("team", 220)["shots"] == 2, \
+        """all seasons totals should be kept"""
+
+    store.add_game(season[1].get_shots_for_game(), 1, "2004/2005")
+    assert store.get("team", 217, "2004/2005")["shots"] == 2, \
+        """re-adding a game should replace its shots"""
+
+    store.remove_game(1)
+    store.remove_game(2)
+    assert store.get("team", 217) is None, \
+        """removing every game should remove the totals"""
+
+    with pytest.raises(AssertionError):
+        store.add_game(season[1].get_shots_for_game(), 1, None)
+    with pytest.raises(AssertionError):
+        store.update_from_season(season, None)
+    assert len(store) == 0, \
+        """games without a season should not be added, since they would be
+        counted twice in the all seasons totals"""
+
+
+def test_shot_aggregate_store_save(sample_json, tmp_path):
+    # check that the store can be saved and loaded again
+    path = str(tmp_path / "totals.json")
+    store = ShotAggregateStore(path)
+    store.add_game(Game(sample_json).get_shots_for_game(), 1, "2004/2005")
+    store.save()
+
+    loaded = ShotAggregateStore(path)
+    assert 1 in loaded and len(loaded) == 1, \
+        """saved games should be loaded"""
+    assert loaded.get("player", 19677) == store.get("player", 19677), \
+        """saved totals should be loaded"""
+    assert loaded.get("player", 19677)["name"] == "Karim Benzema", \
+        """player names should be kept"""
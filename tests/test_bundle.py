@@ -0,0 +1,42 @@
+import json
+from sbdataextraction.sbdataextraction import Game
+from sbdataextraction.bundle import write_season_bundle, read_season_bundle
+from sbdataextraction.bundle import read_game_from_bundle, read_bundle_index
+
+season = {1: Game(json.dumps([{"id": "a", "index": 1}])),
+          2: Game(json.dumps([{"id": "b", "index": 1},
+                              {"id": "c", "index": 2}]))}
+
+
+def test_write_read_season_bundle(tmp_path):
+    # check that a bundle round trips every game of a season
+    path = str(tmp_path / "season.sbd")
+    index = write_season_bundle(season, path)
+    assert sorted(index) == [1, 2], \
+        """bundle index should contain every game id"""
+    assert read_bundle_index(path) == index, \
+        """index read from file should match the written index"""
+
+    read_back = read_season_bundle(path)
+    assert sorted(read_back) == [1, 2], \
+        """read_season_bundle should return every game"""
+    assert read_back[2].json_file == season[2].json_file, \
+        """event data should be unchanged by the bundle"""
+    assert read_back[2].payload_hash == season[2].payload_hash, \
+        """raw payload should be unchanged by the bundle, so that cached
+        data frames are shared with the original games"""
+
+
+def test_read_game_from_bundle(tmp_path):
+    # check that a single game can be read from a bundle
+    path = str(tmp_path / "season.sbd")
+    write_season_bundle(season, path)
+    game = read_game_from_bundle(path, 1)
+    assert isinstance(game, Game), \
+        """read_game_from_bundle should return a Game object"""
+    assert game.json_file == season[1].json_file, \
+        """event data should be unchanged by the bundle"""
+    try:
+        read_game_from_bundle(path, 3)
+    except AssertionError:
+        pass
@@ -0,0 +1,42 @@
+from sbdataextraction import sbdataextraction as sbd
+from sbdataextraction.sbdataextraction import Game
+from sbdataextraction.cache import DerivedCache
+
+
+def test_get_shots_for_game_cache(sample_json, tmp_path):
+    # check that shots are only extracted once per game and are reused
+    # across Game objects through the on-disk cache
+    cache = DerivedCache(str(tmp_path))
+    game = Game(sample_json, match_id=1)
+    shots_df = game.get_shots_for_game(cache=cache)
+    assert shots_df.shape == (2, 17), \
+        """sample game should have 2 shots"""
+
+    shots_df["game_id"] = 1
+    assert game.get_shots_for_game().shape[1] == 17, \
+        """modifying a returned data frame should not modify the cache"""
+
+    new_game = Game(sample_json, match_id=1)
+    assert new_game.get_shots_for_game(cache=cache).shape == (2, 17), \
+        """shots should be loaded from the on-disk cache"""
+    assert new_game._json_file is None, \
+        """a cache hit should not parse the game's event data"""
+
+    version = sbd.SHOT_EXTRACTOR_VERSION
+    assert cache.get("shots", 1, game.payload_hash, version) is not None, \
+        """the game's payload should hit the cache"""
+    other_game = Game(sample_json[:-1] + ", {}]", match_id=1)
+    assert cache.get("shots", 1, other_game.payload_hash, version) is None, \
+        """a different payload should not hit the cache"""
+
+
+def test_get_events_for_game_cache(sample_json, tmp_path):
+    # check that repeated calls to get_events_for_game give the same result
+    cache = DerivedCache(str(tmp_path))
+    game = Game(sample_json, match_id=1)
+    events_df = game.get_events_for_game(cache=cache)
+    assert events_df.shape == (5, 12), \
+        """sample game should have 5 events"""
+    assert events_df.equals(Game(sample_json, match_id=1)
+                            .get_events_for_game(cache=cache)), \
+        """events should be loaded from the on-disk cache"""
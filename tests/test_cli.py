@@ -0,0 +1,47 @@
+import io
+import json
+import subprocess
+import sys
+import pandas as pd
+from sbdataextraction import cli
+from sbdataextraction.sbdataextraction import Game
+from sbdataextraction.bundle import write_season_bundle
+
+
+def test_cli_lazy_imports():
+    # check that importing the command line interface does not import
+    # pandas, numpy, requests or matplotlib
+    code = "import sys, sbdataextraction.cli; " + \
+           "print([m for m in ('pandas', 'numpy', 'requests', " + \
+           "'matplotlib') if m in sys.modules])"
+    output = subprocess.run([sys.executable, "-c", code],
+                            stdout=subprocess.PIPE, check=True).stdout
+    assert output.strip() == b"[]", \
+        """heavy dependencies should only be imported by subcommands"""
+
+
+def test_cli_competitions(monkeypatch, capsys):
+    # check that competitions are listed and can be filtered
+    competitions = [{"competition_id": 11, "season_id": 37,
+                     "competition_name": "La Liga",
+                     "season_name": "2004/2005"},
+                    {"competition_id": 43, "season_id": 3,
+                     "competition_name": "FIFA World Cup",
+                     "season_name": "2018"}]
+    monkeypatch.setattr(cli.urllib.request, "urlopen",
+                        lambda url, **kwargs: io.BytesIO(
+                            json.dumps(competitions).encode("utf-8")))
+    cli.main(["competitions", "--competition-id", "43"])
+    lines = capsys.readouterr().out.splitlines()
+    assert lines[1:] == ["43\t3\tFIFA World Cup\t2018"], \
+        """only the specified competition should be listed"""
+
+
+def test_cli_events(sample_json, tmp_path):
+    # check that events of a game in a bundle are written as csv
+    bundle_path = str(tmp_path / "season.sbd")
+    output_path = str(tmp_path / "events.csv")
+    write_season_bundle({1: Game(sample_json)}, bundle_path)
+    cli.main(["events", "1", "--bundle", bundle_path, "-o", output_path])
+    assert pd.read_csv(output_path).shape == (5, 13), \
+        """events csv should contain the event id and 12 columns"""
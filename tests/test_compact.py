@@ -0,0 +1,61 @@
+import json
+import pickle
+import matplotlib.pyplot as plt
+from sbdataextraction.sbdataextraction import Game, plot_shot_freeze_frame
+from sbdataextraction.compact import CompactGame, CompactEvent
+from sbdataextraction.bundle import write_season_bundle, read_season_bundle
+
+
+def test_compact_game_events(sample_json):
+    # check that compact events behave like the original dictionaries
+    events = json.loads(sample_json)
+    compact_game = CompactGame(sample_json)
+    assert [dict(event) for event in compact_game.json_file] == events, \
+        """compact events should hold the same data as the original ones"""
+    first, second = compact_game.json_file[:2]
+    assert first["player"] is second["player"], \
+        """repeated player dictionaries should be shared"""
+    assert "shot" in compact_game.json_file[3] and \
+        "shot" not in compact_game.json_file[0], \
+        """event type fields should only be found in their events"""
+
+
+def test_compact_event_pickle():
+    # check that compact events, including missing and raw fields, survive
+    # pickling
+    event = {"id": "lineup", "index": 1,
+             "type": {"id": 35, "name": "Starting XI"},
+             "tactics": {"formation": 433, "lineup": []}}
+    compact_event = CompactEvent(event, {})
+    assert "possession" not in compact_event and len(compact_event) == 4, \
+        """missing fields should not be in a compact event"""
+    assert compact_event["tactics"] == event["tactics"], \
+        """raw fields should be parsed when accessed"""
+
+    read_back = pickle.loads(pickle.dumps(compact_event))
+    assert dict(read_back) == event and len(read_back) == 4 and \
+        "possession" not in read_back, \
+        """pickling should not change a compact event"""
+
+
+def test_compact_game_extraction(sample_json, tmp_path):
+    # check that extraction, plotting and bundles work on a CompactGame
+    game = Game(sample_json)
+    compact_game = CompactGame.from_game(Game(sample_json))
+    assert compact_game.get_shots_for_game().equals(
+        game.get_shots_for_game()), \
+        """get_shots_for_game should be unchanged by compacting the game"""
+    assert compact_game.get_events_for_game().equals(
+        game.get_events_for_game()), \
+        """get_events_for_game should be unchanged by compacting the game"""
+
+    fig, ax = plt.subplots(1, 1)
+    assert plot_shot_freeze_frame(compact_game, "shot-1", ax) is ax, \
+        """plot_shot_freeze_frame should work on a CompactGame"""
+
+    path = str(tmp_path / "season.sbd")
+    write_season_bundle({1: compact_game}, path)
+    read_back = read_season_bundle(path)[1]
+    assert read_back.json_file == game.json_file and \
+        read_back.payload_hash == game.payload_hash, \
+        """a CompactGame should be written to bundles like a Game"""
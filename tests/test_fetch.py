@@ -0,0 +1,107 @@
+import pytest
+import requests
+from sbdataextraction import sbdataextraction as sbd
+from sbdataextraction.sbdataextraction import fetch_matches_for_season
+
+MATCHES = sbd.MATCHES_URL + "/1/2.json"
+
+
+class FakeWeb:
+    """
+    Stand-in for requests.get, serving pages from a dictionary. Status codes
+    queued in failures[url] are returned, in order, before the page itself
+    (None raises a connection error and "timeout" a timeout).
+    """
+
+    def __init__(self, pages):
+        self.pages = pages
+        self.failures = {}
+        self.calls = []
+        self.timeouts = []
+
+    def get(self, url, timeout=None):
+        self.calls.append(url)
+        self.timeouts.append(timeout)
+        failures = self.failures.get(url, [])
+        status_code = failures.pop(0) if failures else 200
+        if status_code is None:
+            raise requests.exceptions.ConnectionError(url)
+        if status_code == "timeout":
+            raise requests.exceptions.Timeout(url)
+        response = requests.models.Response()
+        response.status_code = status_code
+        response._content = self.pages[url].encode("utf-8")
+        response.url = url
+        return response
+
+
+@pytest.fixture
+def web(monkeypatch):
+    web = FakeWeb({sbd.COMPETITIONS_URL:
+                   '[{"competition_id": 1, "season_id": 2}]',
+                   MATCHES: '[{"match_id": 3}]',
+                   sbd.EVENTS_URL + "/3.json": "[]",
+                   sbd.EVENTS_URL + "/4.json": "[]"})
+    monkeypatch.setattr(sbd.requests, "get", web.get)
+    return web
+
+
+def test_fetch_matches_for_season_checkpoint(web, tmp_path):
+    # check that transient errors are retried and that a rerun with the same
+    # checkpoint directory does not download finished games again
+    web.failures[sbd.EVENTS_URL + "/3.json"] = [503, None]
+    season = fetch_matches_for_season(1, 2, checkpoint_dir=str(tmp_path),
+                                      verbose=False, backoff_factor=0)
+    assert list(season) == [3], \
+        """season should contain the checkpointed game"""
+    assert web.calls.count(sbd.EVENTS_URL + "/3.json") == 3, \
+        """5xx responses and connection errors should be retried"""
+
+    web.calls.clear()
+    fetch_matches_for_season(1, 2, checkpoint_dir=str(tmp_path),
+                             verbose=False)
+    assert web.calls == [sbd.COMPETITIONS_URL, MATCHES], \
+        """checkpointed games should be loaded from disk"""
+
+
+def test_fetch_matches_for_season_refresh(web, tmp_path):
+    # check that the match list is refreshed on reruns, and read from the
+    # checkpoint when it cannot be downloaded
+    fetch_matches_for_season(1, 2, checkpoint_dir=str(tmp_path),
+                             verbose=False)
+    web.pages[MATCHES] = '[{"match_id": 3}, {"match_id": 4}]'
+    season = fetch_matches_for_season(1, 2, checkpoint_dir=str(tmp_path),
+                                      verbose=False)
+    assert list(season) == [3, 4], \
+        """games added since the last run should be fetched"""
+
+    for url in web.pages:
+        web.failures[url] = [None]
+    season = fetch_matches_for_season(1, 2, checkpoint_dir=str(tmp_path),
+                                      verbose=False, max_retries=0)
+    assert list(season) == [3, 4], \
+        """checkpointed competition and match lists should be used when
+        offline"""
+
+
+def test_fetch_matches_for_season_no_retry(web):
+    # check that permanent errors are raised without retrying
+    web.failures[sbd.EVENTS_URL + "/3.json"] = [404]
+    with pytest.raises(requests.exceptions.HTTPError):
+        fetch_matches_for_season(1, 2, verbose=False, backoff_factor=10)
+    assert web.calls.count(sbd.EVENTS_URL + "/3.json") == 1, \
+        """4xx responses should not be retried"""
+
+
+def test_fetch_matches_for_season_timeout(web):
+    # check that every request is made with a timeout, and that timeouts
+    # are retried
+    web.failures[sbd.EVENTS_URL + "/3.json"] = ["timeout"]
+    season = fetch_matches_for_season(1, 2, verbose=False, backoff_factor=0,
+                                      timeout=5)
+    assert list(season) == [3], \
+        """season should contain the game that timed out once"""
+    assert web.calls.count(sbd.EVENTS_URL + "/3.json") == 2, \
+        """timeouts should be retried"""
+    assert set(web.timeouts) == {5}, \
+        """the timeout should be passed to every request"""
@@ -0,0 +1,76 @@
+import json
+import numpy as np
+from sbdataextraction.sbdataextraction import Game
+from sbdataextraction import geometry
+
+
+def test_distance_and_angle():
+    # check distance and opening angle for shots in front of goal
+    assert np.allclose(geometry.distance_to_goal([100, 120], [40, 30]),
+                       [20, 10]), \
+        """distance should be measured to the center of the goal"""
+    assert np.allclose(geometry.shot_angle([112, 120], [40, 40]),
+                       [2*np.arctan(0.5), np.pi]), \
+        """angle should be the angle between the lines to the posts"""
+
+
+def test_between_shot_and_goal(sample_json):
+    # check that the vectorized test agrees with the scalar one
+    game = Game(sample_json)
+    rng = np.random.RandomState(0)
+    x_shot, x_player = rng.uniform(60, 120, (2, 200))
+    y_shot, y_player = rng.uniform(20, 60, (2, 200))
+    scalar = [game.check_player_btwn_shot_and_goal(*args)
+              for args in zip(x_shot, y_shot, x_player, y_player)]
+    assert list(geometry.between_shot_and_goal(x_shot, y_shot, x_player,
+                                               y_player)) == scalar, \
+        """between_shot_and_goal should match
+        check_player_btwn_shot_and_goal"""
+
+
+def test_goal_blocked_fraction():
+    # check the blocked fraction for an empty, an unblocked and a fully
+    # blocked shot, and that goalkeepers are ignored
+    fraction = geometry.goal_blocked_fraction([100, 100, 100], [40, 40, 40],
+                                              [1, 2], [110, 100.2],
+                                              [60, 40])
+    assert np.isnan(fraction[0]), \
+        """blocked fraction should be NaN for a shot without players"""
+    assert np.allclose(fraction[1:], [0, 1]), \
+        """blocked fraction should be 0 without players in the way and 1
+        with a player right in front of the shot"""
+    fraction = geometry.goal_blocked_fraction([100], [40], [0], [100.2],
+                                              [40], is_goalkeeper=[True])
+    assert np.allclose(fraction, [0]), \
+        """goalkeepers should not block the goal"""
+
+
+def test_get_shots_for_game_geometry(sample_json):
+    # check that geometry features are added as extra columns
+    shots_df = Game(sample_json).get_shots_for_game(geometry_features=True)
+    assert shots_df.shape == (2, 20), \
+        """geometry features should add 3 columns"""
+    assert 0.3 < shots_df.loc["shot-1", "goal blocked fraction"] < 0.4, \
+        """the defender 6 yards in front of the shot should hide about
+        a third of the goal"""
+    assert np.isnan(shots_df.loc["shot-2", "goal blocked fraction"]), \
+        """shots without a freeze frame should have no blocked fraction"""
+    assert shots_df["num opponents between shot and goal"].tolist() == \
+        [1, 0], \
+        """the defender in front of shot-1 should be counted, but not the
+        goalkeeper"""
+
+
+def test_get_shots_for_game_teammates_only(sample_json):
+    # check that a freeze frame without opponents blocks nothing, instead of
+    # being treated as a missing freeze frame
+    events = json.loads(sample_json)
+    shot = next(event for event in events if event["id"] == "shot-2")
+    shot["shot"]["freeze_frame"] = [{"location": [30, 50], "teammate": True,
+                                     "player": {"id": 1, "name": "a"},
+                                     "position": {"id": 23,
+                                                  "name": "Center Forward"}}]
+    shots_df = Game(json.dumps(events)).get_shots_for_game(
+        geometry_features=True)
+    assert shots_df.loc["shot-2", "goal blocked fraction"] == 0, \
+        """a freeze frame with only teammates should not block the goal"""
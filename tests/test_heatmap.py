@@ -0,0 +1,50 @@
+import numpy as np
+import matplotlib.pyplot as plt
+from sbdataextraction.sbdataextraction import Game
+from sbdataextraction.heatmap import PitchGrid, game_heatmaps
+from sbdataextraction.heatmap import merge_heatmaps, plot_heatmap
+
+
+def test_pitch_grid_bin():
+    # check that locations are binned into the right zones
+    grid = PitchGrid.uniform(12, 8)
+    assert list(grid.bin([0, 119, 120, 121], [0, 79, 80, 40])) == \
+        [0, 95, 95, -1], \
+        """pitch edges should belong to the outer zones and locations off
+        the pitch should not be binned"""
+    assert PitchGrid.thirds_and_channels().shape == (3, 5), \
+        """thirds and channels grid should have 15 zones"""
+
+
+def test_game_heatmaps(sample_json):
+    # check per team heatmaps and merging them by addition
+    grid = PitchGrid.thirds_and_channels()
+    events_df = Game(sample_json).get_events_for_game()
+    heatmaps = game_heatmaps(events_df, grid, by="team_id")
+    assert sorted(heatmaps) == [217, 220], \
+        """there should be one heatmap per team"""
+    assert heatmaps[217].counts[2, 2] == 1 and \
+        np.isclose(heatmaps[217].xg_sum[2, 2], 0.3), \
+        """Barcelona's shot should be in the central zone of the
+        final third"""
+    assert game_heatmaps(events_df, grid, event_name="pass")[None] \
+        .counts.sum() == 1, \
+        """sample game should have one pass"""
+
+    store = {}
+    merge_heatmaps(store, heatmaps)
+    merge_heatmaps(store, heatmaps)
+    assert store[217].counts.sum() == 2, \
+        """merged heatmaps should add counts"""
+    assert (store[217] - heatmaps[217]).counts.sum() == 1, \
+        """subtracting a game's heatmap should remove its events"""
+
+
+def test_plot_heatmap(sample_json):
+    # check that plot_heatmap returns the axis it plotted on
+    grid = PitchGrid.uniform()
+    heatmap = game_heatmaps(Game(sample_json).get_shots_for_game(),
+                            grid)[None]
+    fig, ax = plt.subplots(1, 1)
+    assert plot_heatmap(heatmap, ax, values="xg_per_event") is ax, \
+        """plot_heatmap should return matplotlib axis object"""
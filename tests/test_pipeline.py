@@ -0,0 +1,55 @@
+import pandas as pd
+from sbdataextraction import sbdataextraction as sbd
+from sbdataextraction.pipeline import run_league_pipeline, CSVSink
+
+
+class RecordingSink:
+    def __init__(self):
+        self.chunks = []
+
+    def write(self, table, df):
+        self.chunks.append((table, len(df)))
+
+
+def _patch_league(monkeypatch, sample_json):
+    # league with 2 seasons of 2 and 1 games
+    seasons = {"2004/2005": 37, "2005/2006": 38}
+    games = {37: [1, 2], 38: [3]}
+    monkeypatch.setattr(sbd, "_get_league_seasons",
+                        lambda *args, **kwargs: dict(seasons))
+    monkeypatch.setattr(sbd, "iter_matches_for_season",
+                        lambda comp_id, season_id, **kwargs:
+                        ((game_id, sbd.Game(sample_json, match_id=game_id))
+                         for game_id in games[season_id]))
+
+
+def test_run_league_pipeline_chunks(sample_json, monkeypatch):
+    # check that chunks are written every chunk_size games, or every game
+    # when the memory budget is exceeded
+    _patch_league(monkeypatch, sample_json)
+    sink = RecordingSink()
+    rows = run_league_pipeline(11, sink, chunk_size=2, verbose=False)
+    assert rows == {"shots": 6, "events": 15}, \
+        """every shot and event of the league should be written"""
+    assert sink.chunks == [("shots", 4), ("events", 10),
+                           ("shots", 2), ("events", 5)], \
+        """chunks should hold at most chunk_size games"""
+
+    sink = RecordingSink()
+    run_league_pipeline(11, sink, tables=("shots",), season_ids=[37],
+                        memory_budget=0, verbose=False)
+    assert sink.chunks == [("shots", 2), ("shots", 2)], \
+        """a chunk should be written after every game when the memory
+        budget is exceeded"""
+
+
+def test_run_league_pipeline_csv(sample_json, monkeypatch, tmp_path):
+    # check that the csv sink output matches get_shots_for_league
+    _patch_league(monkeypatch, sample_json)
+    run_league_pipeline(11, CSVSink(str(tmp_path)), chunk_size=1,
+                        verbose=False)
+    shots_df = pd.read_csv(str(tmp_path / "shots.csv"), index_col=0)
+    assert shots_df.shape == (6, 19), \
+        """shots csv should have the same columns as get_shots_for_league"""
+    assert list(shots_df["game_id"]) == [1, 1, 2, 2, 3, 3], \
+        """shots should be written in game order"""
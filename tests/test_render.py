@@ -0,0 +1,31 @@
+import os
+import pandas as pd
+from sbdataextraction.sbdataextraction import Game, get_shots_for_season
+from sbdataextraction.render import export_shot_images, export_event_images
+
+
+def test_export_shot_images(sample_json, tmp_path):
+    # check that every shot of a season is rendered and listed in the
+    # manifest
+    season = {1: Game(sample_json)}
+    shots_df = get_shots_for_season(season)
+    manifest = export_shot_images(shots_df, season, str(tmp_path),
+                                  processes=2, dpi=20)
+    assert list(manifest["id"]) == list(shots_df.index), \
+        """manifest should list every shot in order"""
+    assert all(os.path.exists(path) for path in manifest["path"]), \
+        """an image should be written for every shot"""
+    assert pd.read_csv(str(tmp_path / "manifest.csv")).shape == (2, 2), \
+        """manifest should be written to the output directory"""
+
+
+def test_export_event_images(sample_json, tmp_path):
+    # check that every event of a game is rendered as svg
+    events_df = Game(sample_json).get_events_for_game()
+    manifest = export_event_images(events_df, str(tmp_path), fmt="svg",
+                                   processes=1)
+    assert len(manifest) == 5, \
+        """manifest should list every event"""
+    assert all(path.endswith(".svg") and os.path.exists(path)
+               for path in manifest["path"]), \
+        """an svg image should be written for every event"""